@@ -172,6 +172,23 @@ STORAGE_DIRS = {
     'others': os.path.join(MEDIA_ROOT, 'others'),
 }
 
+# REST framework: orjson in place of the stdlib-json renderer and parser
+REST_FRAMEWORK = {
+    'DEFAULT_RENDERER_CLASSES': [
+        'storage.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'storage.renderers.ORJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
+}
+
+# Serialized fuzzy-search index, loaded at startup so workers don't have to
+# re-index every file before their first search
+TRIE_INDEX_PATH = os.path.join(BASE_DIR, 'search_index', 'trie_index.pkl')
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
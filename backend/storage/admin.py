@@ -13,7 +13,7 @@ import json
 
 from .models import (
     MediaFile, JSONDataStore, UploadBatch, DocumentChunk,
-    SearchQuery, FileSearchStore, RAGResponse
+    SearchQuery, FileSearchStore, RAGResponse, ReindexTask
 )
 
 
@@ -23,13 +23,15 @@ from .models import (
 def mark_as_indexed(modeladmin, request, queryset):
     """Mark selected media files as indexed."""
     from django.utils import timezone
-    queryset.update(is_indexed=True, indexed_at=timezone.now())
+    now = timezone.now()
+    queryset.update(is_indexed=True, indexed_at=now, processed_at=now)
 
 
 @admin.action(description='Mark selected files as not indexed')
 def mark_as_not_indexed(modeladmin, request, queryset):
     """Mark selected media files as not indexed."""
-    queryset.update(is_indexed=False, indexed_at=None)
+    from django.utils import timezone
+    queryset.update(is_indexed=False, indexed_at=None, processed_at=timezone.now())
 
 
 @admin.action(description='Delete selected and associated chunks')
@@ -328,8 +330,8 @@ class DocumentChunkAdmin(admin.ModelAdmin):
 
     def embedding_info(self, obj):
         """Display embedding information."""
-        if obj.embedding:
-            return f"Vector (768 dimensions) - First 5: {obj.embedding[:5]}"
+        if obj.embedding is not None:
+            return f"Vector (768 dimensions) - First 5: {obj.embedding.to_list()[:5]}"
         return "No embedding"
     embedding_info.short_description = 'Embedding'
 
@@ -647,6 +649,16 @@ class UploadBatchAdmin(admin.ModelAdmin):
     duration.short_description = 'Duration'
 
 
+@admin.register(ReindexTask)
+class ReindexTaskAdmin(admin.ModelAdmin):
+    """Admin interface for background RAG reindex runs."""
+
+    list_display = ['task_id', 'state', 'is_running', 'current', 'total', 'started_at', 'updated_at']
+    list_filter = ['state', 'is_running']
+    search_fields = ['task_id']
+    readonly_fields = ['task_id', 'current', 'total', 'result', 'error', 'started_at', 'updated_at']
+
+
 # ===== Admin Site Customization =====
 
 admin.site.site_header = "Intelligent Storage Admin"
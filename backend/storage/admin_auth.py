@@ -15,9 +15,12 @@ from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
 from pathlib import Path
 import logging
+import threading
 
 logger = logging.getLogger(__name__)
 
+_BEARER_PREFIX = 'Bearer '
+
 
 class AdminAuthManager:
     """
@@ -418,13 +421,16 @@ class AdminAuthManager:
 
 # Global auth manager instance
 _auth_instance = None
+_init_lock = threading.Lock()
 
 
 def get_auth_manager() -> AdminAuthManager:
     """Get singleton auth manager instance"""
     global _auth_instance
     if _auth_instance is None:
-        _auth_instance = AdminAuthManager()
+        with _init_lock:
+            if _auth_instance is None:
+                _auth_instance = AdminAuthManager()
     return _auth_instance
 
 
@@ -441,15 +447,14 @@ def require_admin(func):
     def wrapper(request, *args, **kwargs):
         # Get token from header
         auth_header = request.META.get('HTTP_AUTHORIZATION', '')
+        token = auth_header.removeprefix(_BEARER_PREFIX)
 
-        if not auth_header.startswith('Bearer '):
+        if token == auth_header:
             from django.http import JsonResponse
             return JsonResponse({
                 'error': 'Missing or invalid authorization header'
             }, status=401)
 
-        token = auth_header[7:]  # Remove 'Bearer ' prefix
-
         # Validate token
         auth_manager = get_auth_manager()
         admin_id = auth_manager.validate_token(token)
@@ -4,13 +4,13 @@ Provides intelligent categorization and metadata extraction.
 """
 
 import json
-import requests
 import base64
 from typing import Dict, Optional, List
 from pathlib import Path
 from django.conf import settings
 import logging
 
+from .ollama_client import ollama_session
 # Import smart database selector
 from .smart_db_selector import smart_db_selector
 
@@ -34,7 +34,7 @@ class OllamaAnalyzer:
     def _get_available_models(self) -> list:
         """Get list of available Ollama models."""
         try:
-            response = requests.get(f"{self.host}/api/tags", timeout=5)
+            response = ollama_session.get(f"{self.host}/api/tags", timeout=5)
             if response.status_code == 200:
                 models = response.json().get('models', [])
                 return [m['name'] for m in models]
@@ -74,7 +74,7 @@ class OllamaAnalyzer:
                     "stream": False
                 }
 
-                response = requests.post(self.generate_url, json=payload, timeout=60)
+                response = ollama_session.post(self.generate_url, json=payload, timeout=60)
 
                 if response.status_code == 200:
                     result = response.json()
@@ -91,7 +91,8 @@ class OllamaAnalyzer:
             return self._fallback_analysis()
 
     def analyze_file_content(self, file_path: str, file_type: str,
-                            user_comment: str = None) -> Dict:
+                            user_comment: str = None,
+                            head: bytes = None) -> Dict:
         """
         Analyze file content to suggest categorization.
 
@@ -99,6 +100,8 @@ class OllamaAnalyzer:
             file_path: Path to the file
             file_type: Detected file type category
             user_comment: Optional user-provided context
+            head: Leading bytes of the file, if already read; used instead
+                of reopening the file
 
         Returns:
             Dict containing suggested category and metadata
@@ -106,7 +109,10 @@ class OllamaAnalyzer:
         try:
             # For text-based files, read content
             if file_type in ['documents', 'programs']:
-                content = self._read_file_safely(file_path)
+                if head is not None:
+                    content = head.decode('utf-8', errors='ignore')[:10000]
+                else:
+                    content = self._read_file_safely(file_path)
             else:
                 content = f"File type: {file_type}"
 
@@ -127,7 +133,7 @@ class OllamaAnalyzer:
                 "stream": False
             }
 
-            response = requests.post(self.generate_url, json=payload, timeout=60)
+            response = ollama_session.post(self.generate_url, json=payload, timeout=60)
 
             if response.status_code == 200:
                 result = response.json()
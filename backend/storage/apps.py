@@ -16,6 +16,7 @@ class StorageConfig(AppConfig):
         """
         Import signals when app is ready.
         This ensures signals are registered properly.
+        Also loads the saved fuzzy search index, if any.
         """
         try:
             # Import signals to register them
@@ -25,3 +26,11 @@ class StorageConfig(AppConfig):
             import logging
             logger = logging.getLogger(__name__)
             logger.warning(f"Failed to import signals: {e}")
+
+        # Warm the fuzzy search index from the last saved snapshot; the first
+        # fuzzy search rebuilds it in the background if the snapshot is stale
+        from django.conf import settings
+        index_path = getattr(settings, 'TRIE_INDEX_PATH', None)
+        if index_path:
+            from .trie_fuzzy_search import trie_search_engine
+            trie_search_engine.load(index_path)
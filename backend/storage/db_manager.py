@@ -5,7 +5,7 @@ Automatically creates schemas and manages data storage.
 
 import json
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterator, List, Any, Optional
 from django.db import connection
 from django.conf import settings
 from pymongo import MongoClient
@@ -13,6 +13,9 @@ from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Rows/documents fetched per round trip when iterating query results
+QUERY_BATCH_SIZE = 2000
+
 
 class DatabaseManager:
     """
@@ -385,23 +388,38 @@ class DatabaseManager:
         Returns:
             List of documents
         """
-        if self.mongo_db is None:
+        try:
+            return list(self.iter_mongodb(collection_name, query, limit))
+        except Exception as e:
+            logger.error(f"MongoDB query failed: {str(e)}")
             return []
 
-        try:
-            collection = self.mongo_db[collection_name]
-            query = query or {}
-            results = list(collection.find(query).limit(limit))
+    def iter_mongodb(self, collection_name: str,
+                     query: Dict = None, limit: int = 100) -> Iterator[Dict]:
+        """
+        Iterate over a MongoDB query, fetching documents in batches.
+
+        Args:
+            collection_name: Collection to query
+            query: MongoDB query filter
+            limit: Maximum documents to yield
+
+        Yields:
+            Documents with ObjectId converted to string
+
+        Query errors propagate to the caller, unlike query_mongodb.
+        """
+        if self.mongo_db is None:
+            return
 
-            # Convert ObjectId to string for JSON serialization
-            for doc in results:
+        collection = self.mongo_db[collection_name]
+        cursor = collection.find(query or {}).limit(limit).batch_size(QUERY_BATCH_SIZE)
+        with cursor:
+            for doc in cursor:
+                # Convert ObjectId to string for JSON serialization
                 if '_id' in doc:
                     doc['_id'] = str(doc['_id'])
-
-            return results
-        except Exception as e:
-            logger.error(f"MongoDB query failed: {str(e)}")
-            return []
+                yield doc
 
     def query_postgresql(self, table_name: str, limit: int = 100) -> List[Dict]:
         """
@@ -415,17 +433,38 @@ class DatabaseManager:
             List of row dicts
         """
         try:
-            with connection.cursor() as cursor:
-                cursor.execute(f"SELECT * FROM {table_name} LIMIT %s", [limit])
-                columns = [col[0] for col in cursor.description]
-                return [
-                    dict(zip(columns, row))
-                    for row in cursor.fetchall()
-                ]
+            return list(self.iter_postgresql(table_name, limit))
         except Exception as e:
             logger.error(f"PostgreSQL query failed: {str(e)}")
             return []
 
+    def iter_postgresql(self, table_name: str, limit: int = 100) -> Iterator[Dict]:
+        """
+        Iterate over a PostgreSQL table through a server-side cursor.
+
+        Args:
+            table_name: Table to query
+            limit: Maximum rows to yield
+
+        Yields:
+            Row dicts
+
+        Query errors propagate to the caller, unlike query_postgresql.
+        """
+        # A named cursor keeps the result set on the server; rows come
+        # over QUERY_BATCH_SIZE at a time instead of all at once
+        with connection.chunked_cursor() as cursor:
+            cursor.execute(f"SELECT * FROM {table_name} LIMIT %s", [limit])
+            columns = None
+            while True:
+                rows = cursor.fetchmany(QUERY_BATCH_SIZE)
+                if not rows:
+                    break
+                if columns is None:
+                    columns = [col[0] for col in cursor.description]
+                for row in rows:
+                    yield dict(zip(columns, row))
+
 
 # Singleton instance
 db_manager = DatabaseManager()
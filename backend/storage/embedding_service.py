@@ -4,12 +4,22 @@ Generates vector embeddings for semantic search.
 """
 
 import logging
-import requests
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any
 from django.conf import settings
 
+from .ollama_client import ollama_session
+
 logger = logging.getLogger(__name__)
 
+# Embedding requests kept in flight at once by generate_embeddings_batch.
+# Ollama batches concurrent requests on the model (OLLAMA_NUM_PARALLEL),
+# so overlapping them keeps the GPU busy instead of idling between calls.
+EMBEDDING_CONCURRENCY = 4
+_EMBEDDERS = ThreadPoolExecutor(
+    max_workers=EMBEDDING_CONCURRENCY, thread_name_prefix='embedding'
+)
+
 
 class EmbeddingService:
     """
@@ -38,7 +48,7 @@ class EmbeddingService:
             return [0.0] * self.embedding_dimension
 
         try:
-            response = requests.post(
+            response = ollama_session.post(
                 f"{self.ollama_host}/api/embeddings",
                 json={
                     "model": self.embedding_model,
@@ -71,19 +81,18 @@ class EmbeddingService:
 
     def generate_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
         """
-        Generate embeddings for multiple texts.
+        Generate embeddings for multiple texts, with up to
+        EMBEDDING_CONCURRENCY requests in flight.
 
         Args:
             texts: List of input texts
 
         Returns:
-            List of embedding vectors
+            List of embedding vectors, in the order of texts
         """
-        embeddings = []
-        for text in texts:
-            embedding = self.generate_embedding(text)
-            embeddings.append(embedding)
-        return embeddings
+        if len(texts) <= 1:
+            return [self.generate_embedding(text) for text in texts]
+        return list(_EMBEDDERS.map(self.generate_embedding, texts))
 
     def ensure_model_available(self) -> bool:
         """
@@ -95,7 +104,7 @@ class EmbeddingService:
         """
         try:
             # Check if model exists
-            response = requests.get(
+            response = ollama_session.get(
                 f"{self.ollama_host}/api/tags",
                 timeout=5
             )
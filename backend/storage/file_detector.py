@@ -1,16 +1,31 @@
 """
 Robust file type detection module.
 Uses multiple methods to accurately detect file types:
-1. Magic bytes (most reliable)
+1. Content model (Magika) or magic bytes (most reliable)
 2. MIME type detection
 3. File extension fallback
 """
 
+import logging
 import magic
 import mimetypes
 import os
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import Dict, List, Optional, Tuple
+
+try:
+    from magika import Magika
+except ImportError:
+    Magika = None
+
+logger = logging.getLogger(__name__)
+
+# Leading bytes handed to libmagic. Large enough for container formats whose
+# signature sits past the first block (OOXML/ODF zip members, tar headers).
+SNIFF_SIZE = 64 * 1024
+
+# Magika predictions below this score fall back to libmagic
+MAGIKA_MIN_SCORE = 0.8
 
 
 class FileTypeDetector:
@@ -73,17 +88,76 @@ class FileTypeDetector:
         }
     }
 
+    # Magika content-type groups mapped to our categories
+    MAGIKA_GROUP_CATEGORIES = {
+        'image': 'images',
+        'video': 'videos',
+        'audio': 'audio',
+        'archive': 'compressed',
+        'executable': 'programs',
+        'document': 'documents',
+        'text': 'documents',
+        'code': 'documents',
+    }
+
+    # Magika labels whose group does not match our category
+    MAGIKA_LABEL_CATEGORIES = {
+        'shell': 'programs',
+        'batch': 'programs',
+        'powershell': 'programs',
+        'apk': 'programs',
+        'jar': 'programs',
+        'deb': 'programs',
+        'rpm': 'programs',
+    }
+
     def __init__(self):
         """Initialize the file detector."""
         self.mime = magic.Magic(mime=True)
         self.description = magic.Magic()
+        self.magika = self._load_magika()
+
+    def _load_magika(self):
+        """Load the Magika model once; None if it is not installed."""
+        if Magika is None:
+            return None
+        try:
+            return Magika()
+        except Exception as e:
+            logger.warning("Magika unavailable, using libmagic only: %s", e)
+            return None
+
+    def identify_paths(self, file_paths: List[str]) -> List[Optional[object]]:
+        """
+        Run Magika over several files in one batched inference.
 
-    def detect_file_type(self, file_path: str) -> Tuple[str, Dict[str, str]]:
+        Returns one Magika result per path (None for all when Magika is not
+        available), to be passed to detect_file_type().
+        """
+        if self.magika is None or not file_paths:
+            return [None] * len(file_paths)
+        try:
+            return self.magika.identify_paths([Path(p) for p in file_paths])
+        except Exception as e:
+            logger.warning("Magika batch identification failed: %s", e)
+            return [None] * len(file_paths)
+
+    def read_head(self, file_path: str) -> bytes:
+        """Read the leading SNIFF_SIZE bytes of a file."""
+        with open(file_path, 'rb') as f:
+            return f.read(SNIFF_SIZE)
+
+    def detect_file_type(self, file_path: str,
+                         head: Optional[bytes] = None,
+                         magika_result=None) -> Tuple[str, Dict[str, str]]:
         """
         Detect file type using multiple methods for robustness.
 
         Args:
             file_path: Path to the file to analyze
+            head: Leading bytes of the file, if the caller already read them
+            magika_result: Magika result from identify_paths(), if the
+                caller batched identification
 
         Returns:
             Tuple of (category, metadata_dict)
@@ -93,13 +167,30 @@ class FileTypeDetector:
         """
         file_path = Path(file_path)
 
-        if not file_path.exists():
+        try:
+            file_size = file_path.stat().st_size
+        except FileNotFoundError:
             raise FileNotFoundError(f"File not found: {file_path}")
 
-        # Gather detection data
+        # Both libmagic lookups run on one in-memory head instead of
+        # each reopening and rereading the file
+        if head is None:
+            head = self.read_head(file_path)
+
+        # Gather detection data; libmagic only runs when Magika is missing
+        # or not confident
         extension = file_path.suffix.lower()
-        mime_type = self._get_mime_type(file_path)
-        magic_desc = self._get_magic_description(file_path)
+        if magika_result is None:
+            magika_result = self._identify_with_magika(file_path, head, file_size)
+        content_category = self._magika_category(magika_result)
+        if content_category is not None:
+            mime_type = magika_result.output.mime_type
+            magic_desc = magika_result.output.description
+            detector = 'magika'
+        else:
+            mime_type = self._get_mime_type(file_path, head)
+            magic_desc = self._get_magic_description(head)
+            detector = 'libmagic'
 
         # Score each category
         scores = {}
@@ -114,9 +205,12 @@ class FileTypeDetector:
             if any(mime_type.startswith(prefix) for prefix in patterns['mime_prefixes']):
                 score += 2
 
-            # Check magic description (weight: 3 - most reliable)
-            if any(pattern.lower() in magic_desc.lower()
-                   for pattern in patterns['magic_patterns']):
+            # Check content detection (weight: 3 - most reliable)
+            if content_category is not None:
+                if category == content_category:
+                    score += 3
+            elif any(pattern.lower() in magic_desc.lower()
+                     for pattern in patterns['magic_patterns']):
                 score += 3
 
             scores[category] = score
@@ -132,31 +226,54 @@ class FileTypeDetector:
             'extension': extension,
             'mime_type': mime_type,
             'magic_description': magic_desc,
-            'file_size': file_path.stat().st_size,
+            'file_size': file_size,
             'file_name': file_path.name,
             'detection_confidence': scores.get(category, 0),
+            'detector': detector,
         }
 
         return category, metadata
 
-    def _get_mime_type(self, file_path: Path) -> str:
+    def _identify_with_magika(self, file_path: Path, head: bytes, file_size: int):
+        """Identify content with Magika, from memory when the head is the whole file."""
+        if self.magika is None:
+            return None
+        try:
+            if len(head) >= file_size:
+                return self.magika.identify_bytes(head)
+            # Magika reads only the leading and trailing blocks itself
+            return self.magika.identify_path(file_path)
+        except Exception as e:
+            logger.warning("Magika identification failed for %s: %s", file_path.name, e)
+            return None
+
+    def _magika_category(self, result) -> Optional[str]:
+        """Map a confident Magika result to a category, else None."""
+        if result is None or not result.ok or result.score < MAGIKA_MIN_SCORE:
+            return None
+        output = result.output
+        return (self.MAGIKA_LABEL_CATEGORIES.get(output.label)
+                or self.MAGIKA_GROUP_CATEGORIES.get(output.group))
+
+    def _get_mime_type(self, file_path: Path, head: bytes) -> str:
         """Get MIME type using python-magic."""
         try:
-            return self.mime.from_file(str(file_path))
+            return self.mime.from_buffer(head)
         except Exception as e:
             # Fallback to mimetypes module
             mime_type, _ = mimetypes.guess_type(str(file_path))
             return mime_type or 'application/octet-stream'
 
-    def _get_magic_description(self, file_path: Path) -> str:
+    def _get_magic_description(self, head: bytes) -> str:
         """Get file description using libmagic."""
         try:
-            return self.description.from_file(str(file_path))
+            return self.description.from_buffer(head)
         except Exception:
             return ''
 
     def get_subcategory_suggestion(self, file_path: str,
-                                   ai_analysis: dict = None) -> str:
+                                   ai_analysis: dict = None,
+                                   detection: Tuple[str, Dict[str, str]] = None) -> str:
         """
         Suggest a subcategory for organizing the file.
         Can be enhanced with AI analysis results.
@@ -164,16 +281,18 @@ class FileTypeDetector:
         Args:
             file_path: Path to the file
             ai_analysis: Optional dict with AI analysis results
+            detection: Optional (category, metadata) from an earlier
+                detect_file_type call, to avoid detecting the file again
 
         Returns:
             Suggested subcategory name
         """
-        category, metadata = self.detect_file_type(file_path)
-
         # If AI analysis is available, use it
         if ai_analysis and 'category' in ai_analysis:
             return self._sanitize_category_name(ai_analysis['category'])
 
+        category, metadata = detection or self.detect_file_type(file_path)
+
         # Otherwise, create basic subcategory from metadata
         if category == 'images':
             # Check if it's a specific image format
@@ -4,7 +4,13 @@ Professional endpoints for intelligent file search
 """
 
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from django.conf import settings
+from django.db import close_old_connections
+from django.db.models import Count, Max
 from django.http import JsonResponse
+from django.utils import timezone
 from django.views.decorators.http import require_http_methods
 from django.views.decorators.csrf import csrf_exempt
 from rest_framework.decorators import api_view
@@ -12,10 +18,18 @@ from rest_framework.response import Response
 from rest_framework import status
 
 from .models import MediaFile
-from .trie_fuzzy_search import trie_search_engine
+from .trie_fuzzy_search import AdaptiveTrieFuzzySearch, trie_search_engine
 
 logger = logging.getLogger(__name__)
 
+# Out-of-sync indexes are rebuilt off the request thread, one at a time
+_REINDEXER = ThreadPoolExecutor(max_workers=1, thread_name_prefix='search-reindex')
+_reindex_lock = threading.Lock()
+
+# The index may have been loaded from a snapshot that predates recent uploads
+# and deletes; the first search in each process checks it against the database
+_snapshot_checked = False
+
 
 def _file_to_dict(media_file):
     """Convert MediaFile model to dictionary for indexing."""
@@ -35,6 +49,65 @@ def _file_to_dict(media_file):
     }
 
 
+def _save_index(search_engine):
+    """Snapshot the index so restarted workers can load it instead of re-indexing."""
+    index_path = getattr(settings, 'TRIE_INDEX_PATH', None)
+    if not index_path:
+        return
+    try:
+        search_engine.save(index_path)
+    except Exception as e:
+        logger.error(f"Error saving search index: {e}")
+
+
+def _rebuild_index(search_engine):
+    """
+    Index all non-deleted files into a fresh engine and swap it in.
+
+    Uploads that land while the rebuild runs are indexed into the live
+    engine and dropped by the swap, so files uploaded since the rebuild
+    began are indexed again once the fresh index is live.
+    """
+    started = timezone.now()
+    fresh = AdaptiveTrieFuzzySearch()
+    for media_file in MediaFile.objects.filter(is_deleted=False):
+        try:
+            fresh.index_file(_file_to_dict(media_file))
+        except Exception as e:
+            logger.error(f"Error indexing file {media_file.id}: {e}")
+
+    search_engine.replace_index(fresh)
+
+    for media_file in MediaFile.objects.filter(is_deleted=False, uploaded_at__gte=started):
+        if media_file.id in search_engine.files_index:
+            continue
+        try:
+            search_engine.index_file(_file_to_dict(media_file))
+        except Exception as e:
+            logger.error(f"Error indexing file {media_file.id}: {e}")
+
+    _save_index(search_engine)
+    return len(search_engine.files_index)
+
+
+def _background_rebuild(search_engine):
+    """Reindex task for the worker thread; releases the single-flight lock."""
+    try:
+        indexed = _rebuild_index(search_engine)
+        logger.info(f"Background reindex complete: {indexed} files")
+    except Exception as e:
+        logger.error(f"Background reindex failed: {e}")
+    finally:
+        close_old_connections()
+        _reindex_lock.release()
+
+
+def _schedule_rebuild(search_engine):
+    """Queue a background reindex unless one is already running."""
+    if _reindex_lock.acquire(blocking=False):
+        _REINDEXER.submit(_background_rebuild, search_engine)
+
+
 @api_view(['POST'])
 def initialize_search_index(request):
     """
@@ -58,6 +131,7 @@ def initialize_search_index(request):
                 logger.error(f"Error indexing file {media_file.id}: {e}")
                 continue
 
+        _save_index(trie_search_engine)
         stats = trie_search_engine.get_stats()
 
         return Response({
@@ -134,6 +208,7 @@ def fuzzy_search(request):
     Returns:
         JSON response with ranked search results
     """
+    global _snapshot_checked
     try:
         # Get parameters
         if request.method == 'POST':
@@ -153,22 +228,32 @@ def fuzzy_search(request):
 
         # Auto-index if empty or small index
         from .trie_fuzzy_search import trie_search_engine as search_engine
-        stats = search_engine.get_stats()
-        db_file_count = MediaFile.objects.filter(is_deleted=False).count()
-
-        # Re-index if index is empty or significantly out of sync
-        if stats['total_files_indexed'] == 0 or stats['total_files_indexed'] < db_file_count * 0.5:
-            logger.info(f"Auto-indexing files. DB: {db_file_count}, Indexed: {stats['total_files_indexed']}")
-
-            # Index all non-deleted files
-            all_files = MediaFile.objects.filter(is_deleted=False)
-            for media_file in all_files:
-                try:
-                    file_dict = _file_to_dict(media_file)
-                    search_engine.index_file(file_dict)
-                except Exception as e:
-                    logger.error(f"Error indexing file {media_file.id}: {e}")
-                    continue
+        # Only the file count is needed; get_stats() would walk the whole Trie
+        indexed_count = len(search_engine.files_index)
+        db_files = MediaFile.objects.filter(is_deleted=False).aggregate(
+            count=Count('id'), last_id=Max('id')
+        )
+        db_file_count = db_files['count']
+
+        # Re-index if index is empty or significantly out of sync. An empty
+        # index has nothing to serve, so it is built inline; otherwise the
+        # current index answers while a rebuild runs in the background.
+        if indexed_count == 0 and db_file_count:
+            logger.info(f"Auto-indexing files. DB: {db_file_count}, Indexed: 0")
+            with _reindex_lock:
+                if not search_engine.files_index:
+                    _rebuild_index(search_engine)
+        elif indexed_count < db_file_count * 0.5:
+            logger.info(f"Scheduling background reindex. DB: {db_file_count}, Indexed: {indexed_count}")
+            _schedule_rebuild(search_engine)
+        elif not _snapshot_checked:
+            # Uploads change the newest id and deletes the count, so a
+            # snapshot that matches both is current
+            _snapshot_checked = True
+            last_indexed = max(search_engine.files_index, default=None)
+            if (indexed_count, last_indexed) != (db_file_count, db_files['last_id']):
+                logger.info("Search index snapshot is stale, scheduling background reindex")
+                _schedule_rebuild(search_engine)
 
         # Perform search
         results = search_engine.search(
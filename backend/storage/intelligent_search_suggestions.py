@@ -9,6 +9,7 @@ Combines multiple strategies for smart search suggestions:
 5. Trending searches - Popular recent queries
 """
 
+import heapq
 import json
 import time
 from datetime import datetime, timedelta
@@ -285,9 +286,8 @@ class IntelligentSearchSuggestions:
             })
 
         # Popular searches
-        popular = sorted(self.search_cache.items(),
-                        key=lambda x: x[1].get('hit_count', 0),
-                        reverse=True)[:3]
+        popular = heapq.nlargest(3, self.search_cache.items(),
+                                 key=lambda x: x[1].get('hit_count', 0))
 
         for query_lower, data in popular:
             suggestions.append({
@@ -337,7 +337,7 @@ class IntelligentSearchSuggestions:
                 if len(matches) >= limit:
                     break
 
-        return sorted(matches, key=lambda x: x['score'], reverse=True)[:limit]
+        return heapq.nlargest(limit, matches, key=lambda x: x['score'])
 
     def _get_popular_searches(self, partial: str, limit: int) -> List[Dict]:
         """Get popular searches across all users"""
@@ -365,7 +365,7 @@ class IntelligentSearchSuggestions:
                     'last_accessed': data['last_accessed']
                 })
 
-        return sorted(matches, key=lambda x: x['score'], reverse=True)[:limit]
+        return heapq.nlargest(limit, matches, key=lambda x: x['score'])
 
     def _get_trending_searches(self, partial: str, limit: int) -> List[Dict]:
         """Get trending searches (popular in last 24h)"""
@@ -402,7 +402,7 @@ class IntelligentSearchSuggestions:
                     'last_searched': data['last_searched']
                 })
 
-        return sorted(matches, key=lambda x: x['score'], reverse=True)[:limit]
+        return heapq.nlargest(limit, matches, key=lambda x: x['score'])
 
     def _get_semantic_suggestions(self, partial: str, admin_id: str, limit: int) -> List[Dict]:
         """
@@ -553,9 +553,8 @@ class IntelligentSearchSuggestions:
         }
 
         # Top searches
-        top_cache = sorted(self.search_cache.items(),
-                          key=lambda x: x[1].get('hit_count', 0),
-                          reverse=True)[:10]
+        top_cache = heapq.nlargest(10, self.search_cache.items(),
+                                   key=lambda x: x[1].get('hit_count', 0))
 
         analytics['top_searches'] = [
             {
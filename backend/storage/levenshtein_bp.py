@@ -0,0 +1,71 @@
+"""
+Bit-parallel Levenshtein distance (Myers 1999 / Hyyrö 2001).
+
+Packs a whole DP column into the bits of an integer, so each text
+character costs a fixed handful of integer operations instead of a loop
+over the pattern. Patterns up to 63 characters fit in one machine word;
+longer patterns still work because Python integers are unbounded.
+"""
+
+from typing import Dict
+
+
+def build_peq(pattern: str) -> Dict[str, int]:
+    """Map each character to the bitmask of positions where it occurs in pattern."""
+    peq: Dict[str, int] = {}
+    for i, char in enumerate(pattern):
+        peq[char] = peq.get(char, 0) | (1 << i)
+    return peq
+
+
+def bitap_lev(pattern: str, text: str, k: int) -> int:
+    """
+    Edit distance between pattern and text, bounded by k.
+
+    Args:
+        pattern: Pattern string (packed into the bit-vectors)
+        text: Text string (consumed one character at a time)
+        k: Maximum acceptable distance
+
+    Returns:
+        Edit distance, or k + 1 if it exceeds k
+    """
+    m = len(pattern)
+    n = len(text)
+
+    if abs(m - n) > k:
+        return k + 1
+    if m == 0:
+        return n
+
+    peq = build_peq(pattern)
+    mask = (1 << m) - 1
+    high_bit = 1 << (m - 1)
+
+    vp = mask
+    vn = 0
+    score = m
+
+    for j, char in enumerate(text):
+        eq = peq.get(char, 0)
+        xv = eq | vn
+        xh = (((eq & vp) + vp) ^ vp) | eq
+        hp = vn | ~(xh | vp)
+        hn = vp & xh
+
+        if hp & high_bit:
+            score += 1
+        elif hn & high_bit:
+            score -= 1
+
+        # Row 0 grows by one per text character (global alignment)
+        hp = (hp << 1) | 1
+        hn <<= 1
+        vp = (hn | ~(xv | hp)) & mask
+        vn = hp & xv & mask
+
+        # Score can drop by at most one per remaining character
+        if score - (n - j - 1) > k:
+            return k + 1
+
+    return score if score <= k else k + 1
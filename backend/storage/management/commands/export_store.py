@@ -149,8 +149,8 @@ class Command(BaseCommand):
                 }
 
                 # Include embedding if requested
-                if include_embeddings and chunk.embedding:
-                    chunk_data['embedding'] = chunk.embedding
+                if include_embeddings and chunk.embedding is not None:
+                    chunk_data['embedding'] = chunk.embedding.to_list()
 
                 chunks_data.append(chunk_data)
 
@@ -14,12 +14,14 @@ Handles media files with:
 import os
 import hashlib
 import mimetypes
+import secrets
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, Any, Optional, Tuple, BinaryIO
 from PIL import Image
 import magic
 import logging
+import threading
 from .smart_folder_classifier import get_smart_classifier
 
 logger = logging.getLogger(__name__)
@@ -42,6 +44,19 @@ class MediaStorageHandler:
         'document': ['.pdf', '.doc', '.docx', '.txt', '.md', '.csv', '.xlsx']
     }
 
+    # Read size used when streaming uploads to disk
+    CHUNK_SIZE = 1024 * 1024
+
+    # Smart categories rolled up into the media groups reported by stats()
+    STATS_GROUPS = {
+        'images': ('photos', 'gifs', 'vector_graphics', 'webp', 'icons', 'images'),
+        'videos': ('videos_mp4', 'videos_mov', 'videos_avi', 'videos_mkv',
+                   'videos_webm', 'videos_other', 'videos'),
+        'audio': ('audio_music', 'audio_wav', 'audio_ogg', 'audio_other', 'audio'),
+        'documents': ('pdf', 'word', 'excel', 'powerpoint', 'text', 'markdown',
+                      'rtf', 'documents'),
+    }
+
     THUMBNAIL_SIZES = {
         'small': (150, 150),
         'medium': (300, 300),
@@ -88,7 +103,7 @@ class MediaStorageHandler:
         Store media file with smart automatic folder classification
 
         Args:
-            file_data: File binary data
+            file_data: Readable binary stream with the file content
             filename: Original filename
             admin_id: Admin user ID (for access control)
             metadata: Optional metadata dictionary
@@ -96,17 +111,11 @@ class MediaStorageHandler:
         Returns:
             Dictionary with storage information
         """
-        # Read file content
-        content = file_data.read()
+        # Use smart classifier to determine category (sniffs only the head)
+        category, classification_info = self.classifier.classify_file(filename, file_data)
 
-        # Use smart classifier to determine category
-        category, classification_info = self.classifier.classify_file(filename, content)
-
-        # Generate unique filename
-        file_hash = hashlib.sha256(content).hexdigest()
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         file_ext = Path(filename).suffix.lower()
-        unique_filename = f"{admin_id}_{timestamp}_{file_hash[:12]}{file_ext}"
 
         # Get smart folder path (with date-based subdirectories)
         storage_path = self.classifier.get_folder_path(
@@ -115,12 +124,28 @@ class MediaStorageHandler:
             use_date_subfolders=True
         )
 
+        # Stream to a temporary file while hashing, so large uploads are
+        # never held in memory as a whole
+        hasher = hashlib.sha256()
+        file_size = 0
+        temp_path = storage_path / f".{timestamp}_{secrets.token_hex(8)}.part"
+        try:
+            with open(temp_path, 'wb') as f:
+                for chunk in iter(lambda: file_data.read(self.CHUNK_SIZE), b''):
+                    hasher.update(chunk)
+                    f.write(chunk)
+                    file_size += len(chunk)
+        except Exception:
+            temp_path.unlink(missing_ok=True)
+            raise
+
+        # Generate unique filename
+        file_hash = hasher.hexdigest()
+        unique_filename = f"{admin_id}_{timestamp}_{file_hash[:12]}{file_ext}"
+
         # Full file path
         file_path = storage_path / unique_filename
-
-        # Write file
-        with open(file_path, 'wb') as f:
-            f.write(content)
+        os.replace(temp_path, file_path)
 
         logger.info(f"Stored file in smart folder '{category}': {file_path}")
 
@@ -133,7 +158,7 @@ class MediaStorageHandler:
             'category': category,
             'classification': classification_info,
             'file_type': classification_info['mime_type'],
-            'file_size': len(content),
+            'file_size': file_size,
             'storage_path': str(file_path.relative_to(self.base_path)),
             'full_path': str(file_path),
             'admin_id': admin_id,
@@ -155,7 +180,7 @@ class MediaStorageHandler:
         if metadata:
             result['metadata'] = metadata
         else:
-            result['metadata'] = self._extract_metadata(file_path, category, content)
+            result['metadata'] = self._extract_metadata(file_path, category, file_size)
 
         return result
 
@@ -247,21 +272,21 @@ class MediaStorageHandler:
 
         return thumbnails
 
-    def _extract_metadata(self, file_path: Path, file_type: str, content: bytes) -> Dict[str, Any]:
+    def _extract_metadata(self, file_path: Path, file_type: str, file_size: int) -> Dict[str, Any]:
         """
         Extract metadata from file
 
         Args:
             file_path: Path to file
             file_type: Type of file
-            content: File content
+            file_size: File size in bytes
 
         Returns:
             Dictionary with metadata
         """
         metadata = {
-            'file_size_bytes': len(content),
-            'file_size_human': self._human_readable_size(len(content))
+            'file_size_bytes': file_size,
+            'file_size_human': self._human_readable_size(file_size)
         }
 
         # Image-specific metadata
@@ -333,10 +358,13 @@ class MediaStorageHandler:
                             if thumb_path.exists():
                                 file_path = thumb_path
 
+                        mime_type, _ = mimetypes.guess_type(file_path.name)
+
                         return {
                             'file_path': str(file_path),
                             'filename': filename,
                             'category': category,
+                            'mime_type': mime_type or 'application/octet-stream',
                             'exists': True,
                             'size': file_path.stat().st_size
                         }
@@ -438,6 +466,51 @@ class MediaStorageHandler:
 
         return results
 
+    def stats(self, admin_id: str) -> Dict[str, Any]:
+        """
+        Aggregate file counts and sizes for an admin in one directory walk
+
+        Unlike list_media, no per-file dicts are built and each file is
+        stat'ed once (via the cached DirEntry).
+
+        Args:
+            admin_id: Admin user ID
+
+        Returns:
+            Totals, per-category counts and STATS_GROUPS counts
+        """
+        categories: Dict[str, int] = {}
+        total_size = 0
+
+        for category_dir in os.scandir(self.base_path):
+            if not category_dir.is_dir() or category_dir.name in ['thumbnails', 'temp']:
+                continue
+
+            count = 0
+            pending = [category_dir.path]
+            while pending:
+                with os.scandir(pending.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir():
+                            if not entry.is_symlink():
+                                pending.append(entry.path)
+                        elif admin_id in entry.name:
+                            count += 1
+                            total_size += entry.stat().st_size
+
+            if count:
+                categories[category_dir.name] = count
+
+        result = {
+            'total': sum(categories.values()),
+            'total_size_bytes': total_size,
+            'categories': categories,
+        }
+        for group, members in self.STATS_GROUPS.items():
+            result[group] = sum(categories.get(name, 0) for name in members)
+
+        return result
+
     @staticmethod
     def _human_readable_size(size_bytes: int) -> str:
         """Convert bytes to human-readable format"""
@@ -450,11 +523,14 @@ class MediaStorageHandler:
 
 # Global storage handler instance
 _storage_instance = None
+_init_lock = threading.Lock()
 
 
 def get_media_storage() -> MediaStorageHandler:
     """Get singleton media storage instance"""
     global _storage_instance
     if _storage_instance is None:
-        _storage_instance = MediaStorageHandler()
+        with _init_lock:
+            if _storage_instance is None:
+                _storage_instance = MediaStorageHandler()
     return _storage_instance
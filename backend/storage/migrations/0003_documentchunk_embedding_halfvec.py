@@ -0,0 +1,19 @@
+# Generated by Django 5.2.8 on 2026-10-15 12:00
+
+import pgvector.django.halfvec
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('storage', '0002_jsondatastore_schema_file'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='documentchunk',
+            name='embedding',
+            field=pgvector.django.halfvec.HalfVectorField(dimensions=768, help_text='Vector embedding generated by Ollama nomic-embed-text model'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.8 on 2026-10-15 12:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('storage', '0003_documentchunk_embedding_halfvec'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='mediafile',
+            index=models.Index(fields=['processed_at'], name='storage_med_process_d5b6eb_idx'),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.8 on 2026-10-15 14:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('storage', '0004_mediafile_processed_at_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReindexTask',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('task_id', models.CharField(max_length=32, unique=True)),
+                ('state', models.CharField(choices=[('PENDING', 'Pending'), ('PROGRESS', 'In progress'), ('SUCCESS', 'Succeeded'), ('FAILURE', 'Failed')], default='PENDING', max_length=20)),
+                ('is_running', models.BooleanField(default=True)),
+                ('current', models.IntegerField(default=0)),
+                ('total', models.IntegerField(default=0)),
+                ('result', models.JSONField(blank=True, null=True)),
+                ('error', models.TextField(blank=True, null=True)),
+                ('started_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'ordering': ['-started_at'],
+                'constraints': [models.UniqueConstraint(condition=models.Q(('is_running', True)), fields=('is_running',), name='storage_single_running_reindex')],
+            },
+        ),
+    ]
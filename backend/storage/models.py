@@ -2,7 +2,7 @@ from django.db import models
 from django.conf import settings
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.contrib.auth.models import AbstractBaseUser, BaseUserManager, PermissionsMixin
-from pgvector.django import VectorField
+from pgvector.django import HalfVectorField, VectorField
 import uuid
 
 
@@ -292,6 +292,7 @@ class MediaFile(models.Model):
             models.Index(fields=['detected_type']),
             models.Index(fields=['storage_category']),
             models.Index(fields=['uploaded_at']),
+            models.Index(fields=['processed_at']),
             models.Index(fields=['is_deleted']),
             models.Index(fields=['deleted_at']),
         ]
@@ -397,6 +398,46 @@ class UploadBatch(models.Model):
         return f"Batch {self.batch_id} ({self.status})"
 
 
+class ReindexTask(models.Model):
+    """
+    Tracks a background RAG reindex.
+
+    Kept in the database rather than the cache so every worker process sees
+    the same progress and at most one reindex runs across all of them.
+    """
+    task_id = models.CharField(max_length=32, unique=True)
+
+    STATE_CHOICES = [
+        ('PENDING', 'Pending'),
+        ('PROGRESS', 'In progress'),
+        ('SUCCESS', 'Succeeded'),
+        ('FAILURE', 'Failed'),
+    ]
+    state = models.CharField(max_length=20, choices=STATE_CHOICES, default='PENDING')
+    is_running = models.BooleanField(default=True)
+
+    current = models.IntegerField(default=0)
+    total = models.IntegerField(default=0)
+    result = models.JSONField(blank=True, null=True)
+    error = models.TextField(blank=True, null=True)
+
+    started_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['-started_at']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['is_running'],
+                condition=models.Q(is_running=True),
+                name='storage_single_running_reindex',
+            ),
+        ]
+
+    def __str__(self):
+        return f"Reindex {self.task_id} ({self.state})"
+
+
 class DocumentChunk(models.Model):
     """
     Stores chunked document content with vector embeddings for semantic search.
@@ -428,8 +469,9 @@ class DocumentChunk(models.Model):
     chunk_size = models.IntegerField(help_text="Number of characters in this chunk")
     token_count = models.IntegerField(default=0, help_text="Estimated token count for this chunk")
 
-    # Vector embedding for semantic search
-    embedding = VectorField(
+    # Vector embedding for semantic search, stored at half precision: half
+    # the size of FP32 on disk and in the index with no visible recall loss
+    embedding = HalfVectorField(
         dimensions=768,
         help_text="Vector embedding generated by Ollama nomic-embed-text model"
     )
@@ -0,0 +1,19 @@
+"""
+Shared HTTP session for calls to the Ollama server.
+
+All modules that talk to Ollama go through one session, so requests reuse
+pooled keep-alive connections instead of opening a new connection per call.
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Upload analysis, embedding and health-probe workers call Ollama
+# concurrently; keep enough pooled connections for all of them
+POOL_MAXSIZE = 16
+
+ollama_session = requests.Session()
+
+_adapter = HTTPAdapter(pool_connections=4, pool_maxsize=POOL_MAXSIZE, max_retries=0)
+ollama_session.mount('http://', _adapter)
+ollama_session.mount('https://', _adapter)
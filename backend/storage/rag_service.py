@@ -4,16 +4,22 @@ Handles document indexing and semantic search using Ollama + PostgreSQL pgvector
 """
 
 import logging
-from typing import List, Dict, Any, Optional
+from typing import Callable, List, Dict, Any, Optional
+from django.db import transaction
 from django.db.models import Q
+from pgvector import HalfVector
 from pgvector.django import L2Distance
 
 from .models import MediaFile, DocumentChunk, SearchQuery
 from .embedding_service import embedding_service
 from .chunking_service import chunking_service
+from .ollama_client import ollama_session
 
 logger = logging.getLogger(__name__)
 
+# Chunks collected across documents before one embedding batch + insert
+REINDEX_BATCH_CHUNKS = 128
+
 
 class RAGService:
     """
@@ -36,57 +42,12 @@ class RAGService:
             Dict with indexing results
         """
         try:
-            # Extract text from file
-            text = self.chunking_service.extract_text_from_file(
-                media_file.file_path,
-                media_file.detected_type
-            )
-
-            if not text or len(text.strip()) < 10:
-                return {
-                    'success': False,
-                    'error': 'No extractable text content',
-                    'chunks_created': 0
-                }
-
-            # Create chunks
-            chunks_data = self.chunking_service.chunk_text(
-                text,
-                metadata={
-                    'file_type': media_file.detected_type,
-                    'file_name': media_file.original_name,
-                    'ai_category': media_file.ai_category,
-                    'ai_tags': media_file.ai_tags,
-                }
-            )
-
-            if not chunks_data:
-                return {
-                    'success': False,
-                    'error': 'Failed to create chunks',
-                    'chunks_created': 0
-                }
+            chunks_data = self._prepare_chunks(media_file)
+            if isinstance(chunks_data, dict):
+                return chunks_data
 
             # Generate embeddings and store chunks
-            chunks_created = 0
-            for chunk_data in chunks_data:
-                # Generate embedding
-                embedding = self.embedding_service.generate_embedding(
-                    chunk_data['chunk_text']
-                )
-
-                # Create DocumentChunk
-                DocumentChunk.objects.create(
-                    media_file=media_file,
-                    chunk_index=chunk_data['chunk_index'],
-                    chunk_text=chunk_data['chunk_text'],
-                    chunk_size=chunk_data['chunk_size'],
-                    embedding=embedding,
-                    file_name=media_file.original_name,
-                    file_type=media_file.detected_type,
-                    metadata=chunk_data['metadata']
-                )
-                chunks_created += 1
+            chunks_created = self._store_chunks([(media_file, chunks_data)])
 
             logger.info(
                 f"Indexed document '{media_file.original_name}' "
@@ -107,6 +68,85 @@ class RAGService:
                 'chunks_created': 0
             }
 
+    def _prepare_chunks(self, media_file: MediaFile):
+        """
+        Extract and chunk a document's text.
+
+        Returns:
+            List of chunk dicts, or an index_document failure dict
+        """
+        # Extract text from file
+        text = self.chunking_service.extract_text_from_file(
+            media_file.file_path,
+            media_file.detected_type
+        )
+
+        if not text or len(text.strip()) < 10:
+            return {
+                'success': False,
+                'error': 'No extractable text content',
+                'chunks_created': 0
+            }
+
+        # Create chunks
+        chunks_data = self.chunking_service.chunk_text(
+            text,
+            metadata={
+                'file_type': media_file.detected_type,
+                'file_name': media_file.original_name,
+                'ai_category': media_file.ai_category,
+                'ai_tags': media_file.ai_tags,
+            }
+        )
+
+        if not chunks_data:
+            return {
+                'success': False,
+                'error': 'Failed to create chunks',
+                'chunks_created': 0
+            }
+
+        return chunks_data
+
+    def _store_chunks(self, documents) -> int:
+        """
+        Embed the chunks of one or more documents in a single batch and
+        insert them together, all or nothing.
+
+        Args:
+            documents: List of (media_file, chunks_data) pairs
+
+        Returns:
+            Number of chunks created
+        """
+        pending = [
+            (media_file, chunk_data)
+            for media_file, chunks_data in documents
+            for chunk_data in chunks_data
+        ]
+        embeddings = self.embedding_service.generate_embeddings_batch(
+            [chunk_data['chunk_text'] for _, chunk_data in pending]
+        )
+
+        with transaction.atomic():
+            DocumentChunk.objects.bulk_create(
+                [
+                    DocumentChunk(
+                        media_file=media_file,
+                        chunk_index=chunk_data['chunk_index'],
+                        chunk_text=chunk_data['chunk_text'],
+                        chunk_size=chunk_data['chunk_size'],
+                        embedding=embedding,
+                        file_name=media_file.original_name,
+                        file_type=media_file.detected_type,
+                        metadata=chunk_data['metadata']
+                    )
+                    for (media_file, chunk_data), embedding in zip(pending, embeddings)
+                ],
+                batch_size=500
+            )
+        return len(pending)
+
     def search(
         self,
         query: str,
@@ -138,7 +178,7 @@ class RAGService:
 
             # Perform vector similarity search
             results = queryset.order_by(
-                L2Distance('embedding', query_embedding)
+                L2Distance('embedding', HalfVector(query_embedding))
             )[:limit]
 
             # Format results
@@ -222,7 +262,6 @@ class RAGService:
         Returns:
             Dict with response and sources
         """
-        import requests
         from django.conf import settings
 
         try:
@@ -248,7 +287,7 @@ Answer:"""
             ollama_host = settings.OLLAMA_SETTINGS['HOST']
             ollama_model = settings.OLLAMA_SETTINGS['MODEL']
 
-            response = requests.post(
+            response = ollama_session.post(
                 f"{ollama_host}/api/generate",
                 json={
                     "model": ollama_model,
@@ -289,10 +328,17 @@ Answer:"""
                 'error': str(e)
             }
 
-    def reindex_all_documents(self) -> Dict[str, Any]:
+    def reindex_all_documents(
+        self,
+        progress: Optional[Callable[[int, int], None]] = None
+    ) -> Dict[str, Any]:
         """
         Reindex all media files.
 
+        Args:
+            progress: Optional callback called as progress(processed, total)
+                as each file is chunked
+
         Returns:
             Dict with reindexing statistics
         """
@@ -308,15 +354,58 @@ Answer:"""
         media_files = MediaFile.objects.filter(
             detected_type__in=indexable_types
         )
-
-        for media_file in media_files:
+        file_count = media_files.count()
+
+        # Chunks of several files are embedded and inserted together, once
+        # at least REINDEX_BATCH_CHUNKS are pending
+        batch = []
+        batch_chunks = 0
+
+        def flush():
+            nonlocal successful, failed
+            try:
+                self._store_chunks(batch)
+                successful += len(batch)
+                return
+            except Exception as e:
+                logger.error(f"Failed to index batch of {len(batch)} documents: {str(e)}")
+
+            # Retry one document at a time so a single bad document doesn't
+            # fail the rest of its batch
+            for document in batch:
+                try:
+                    self._store_chunks([document])
+                    successful += 1
+                except Exception as e:
+                    logger.error(f"Failed to index document {document[0].id}: {str(e)}")
+                    failed += 1
+
+        for media_file in media_files.iterator():
             total += 1
-            result = self.index_document(media_file)
-
-            if result['success']:
-                successful += 1
-            else:
+            try:
+                chunks_data = self._prepare_chunks(media_file)
+            except Exception as e:
+                logger.error(f"Failed to index document: {str(e)}")
+                chunks_data = None
+
+            # Progress counts documents read and chunked; storing them is
+            # batched, so reporting at flush time would lag by a whole batch
+            if progress is not None:
+                progress(total, file_count)
+
+            if not isinstance(chunks_data, list):
                 failed += 1
+                continue
+
+            batch.append((media_file, chunks_data))
+            batch_chunks += len(chunks_data)
+            if batch_chunks >= REINDEX_BATCH_CHUNKS:
+                flush()
+                batch = []
+                batch_chunks = 0
+
+        if batch:
+            flush()
 
         return {
             'total_processed': total,
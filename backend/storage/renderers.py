@@ -0,0 +1,68 @@
+"""
+orjson-backed JSON renderer and parser for the REST framework views.
+
+Drop-in replacements for DRF's JSONRenderer/JSONParser: large upload
+responses (AI analysis, generated schemas, serialized records) are encoded
+and decoded in C instead of through the stdlib json module.
+"""
+
+import orjson
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.settings import api_settings
+from rest_framework.utils import json
+from rest_framework.utils.encoders import JSONEncoder
+
+# Types orjson can't serialize natively (Decimal, lazy strings, querysets...)
+# and datetimes, which DRF formats its own way, go through DRF's encoder
+_DRF_DEFAULT = JSONEncoder().default
+_DUMPS_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+
+def dumps(data):
+    """Encode data to JSON bytes exactly as ORJSONRenderer does."""
+    return orjson.dumps(data, default=_DRF_DEFAULT, option=_DUMPS_OPTIONS)
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    Render response data to JSON with orjson.
+
+    Indented output (the browsable API, or an ``indent=`` media type
+    parameter) is rare and orjson only indents by two spaces, so those
+    requests are rendered by DRF's JSONRenderer instead.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+        return dumps(data)
+
+
+class ORJSONParser(BaseParser):
+    """
+    Parse JSON request bodies with orjson.
+
+    orjson rejects some input the stdlib accepts (integers beyond 64 bits,
+    and NaN/Infinity when STRICT_JSON is off); those bodies are parsed again
+    the way DRF's JSONParser would, so no previously valid request breaks.
+    """
+
+    media_type = 'application/json'
+    renderer_class = ORJSONRenderer
+    strict = api_settings.STRICT_JSON
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        body = stream.read()
+        try:
+            return orjson.loads(body)
+        except orjson.JSONDecodeError:
+            pass
+        parse_constant = json.strict_constant if self.strict else None
+        try:
+            return json.loads(body, parse_constant=parse_constant)
+        except ValueError as e:
+            raise ParseError(f'JSON parse error - {e}')
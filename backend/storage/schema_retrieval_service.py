@@ -10,11 +10,11 @@ Provides intelligent schema retrieval with:
 
 import json
 import logging
-import requests
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 from django.conf import settings
 from .models import MediaFile, JSONDataStore
+from .ollama_client import ollama_session
 
 logger = logging.getLogger(__name__)
 
@@ -51,7 +51,7 @@ class SchemaQueryParser:
             prompt = self._create_parsing_prompt(query)
 
             # Call Ollama API
-            response = requests.post(
+            response = ollama_session.post(
                 f"{self.ollama_base_url}/api/generate",
                 json={
                     "model": self.model,
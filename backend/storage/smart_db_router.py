@@ -14,6 +14,7 @@ from django.db import connection
 from pymongo import MongoClient, ASCENDING, DESCENDING
 from .json_analyzer import analyze_json_for_database, AnalysisResult
 import logging
+import threading
 import ijson
 
 logger = logging.getLogger(__name__)
@@ -739,6 +740,35 @@ class SmartDatabaseRouter:
             logger.error(f"Error listing documents: {e}")
             return []
 
+    def count_documents(self, admin_id: str) -> Dict[str, int]:
+        """
+        Count an admin's documents per database type
+
+        Runs a single $group aggregation on the metadata collection instead
+        of listing documents and counting them in Python.
+
+        Args:
+            admin_id: Admin user ID
+
+        Returns:
+            {'sql': int, 'nosql': int}
+        """
+        counts = {'sql': 0, 'nosql': 0}
+
+        try:
+            pipeline = [
+                {'$match': {'admin_id': admin_id}},
+                {'$group': {'_id': '$database_type', 'count': {'$sum': 1}}}
+            ]
+            for row in self.metadata_collection.aggregate(pipeline):
+                if row['_id'] in counts:
+                    counts[row['_id']] = row['count']
+
+        except Exception as e:
+            logger.error(f"Error counting documents: {e}")
+
+        return counts
+
     def delete_document(self, doc_id: str, admin_id: str) -> bool:
         """
         Delete document (admin-only)
@@ -779,14 +809,75 @@ class SmartDatabaseRouter:
             logger.error(f"Error deleting {doc_id}: {e}", exc_info=True)
             return False
 
+    def delete_documents(self, doc_ids: List[str], admin_id: str) -> Tuple[List[str], List[str]]:
+        """
+        Delete several documents in one pass (admin-only)
+
+        Ownership is resolved with a single metadata query, then each store
+        gets one bulk delete instead of one round-trip per document. Each
+        store's metadata is removed as soon as that store's delete succeeds,
+        so a failure in the other store can't leave deleted documents listed.
+
+        Args:
+            doc_ids: Document IDs
+            admin_id: Admin user ID
+
+        Returns:
+            (IDs that were owned by the admin and deleted,
+             owned IDs whose delete failed; their documents may be gone
+             while their metadata remains)
+        """
+        owned = list(self.metadata_collection.find(
+            {'doc_id': {'$in': doc_ids}, 'admin_id': admin_id},
+            {'doc_id': 1, 'database_type': 1}
+        ))
+
+        sql_ids = [doc['doc_id'] for doc in owned if doc.get('database_type') == 'sql']
+        nosql_ids = [doc['doc_id'] for doc in owned if doc.get('database_type') != 'sql']
+
+        def delete_sql():
+            with connection.cursor() as cursor:
+                cursor.execute("DELETE FROM json_documents WHERE doc_id = ANY(%s) AND admin_id = %s",
+                             [sql_ids, admin_id])
+
+        def delete_nosql():
+            self.json_documents.delete_many({'doc_id': {'$in': nosql_ids}, 'admin_id': admin_id})
+
+        deleted = []
+        failed = []
+        for ids, delete_store in ((sql_ids, delete_sql), (nosql_ids, delete_nosql)):
+            if not ids:
+                continue
+            try:
+                delete_store()
+            except Exception as e:
+                logger.error(f"Error bulk deleting documents: {e}", exc_info=True)
+                failed.extend(ids)
+                continue
+            try:
+                self.metadata_collection.delete_many({'doc_id': {'$in': ids}})
+            except Exception as e:
+                # Still listed, so retrying the delete finishes the job
+                logger.error(f"Error deleting metadata for {len(ids)} documents: {e}", exc_info=True)
+                failed.extend(ids)
+                continue
+            deleted.extend(ids)
+
+        if deleted:
+            logger.info(f"{len(deleted)} documents deleted for {admin_id}")
+        return deleted, failed
+
 
 # Global router instance
 _router_instance = None
+_init_lock = threading.Lock()
 
 
 def get_db_router() -> SmartDatabaseRouter:
     """Get singleton database router instance"""
     global _router_instance
     if _router_instance is None:
-        _router_instance = SmartDatabaseRouter()
+        with _init_lock:
+            if _router_instance is None:
+                _router_instance = SmartDatabaseRouter()
     return _router_instance
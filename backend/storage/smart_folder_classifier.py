@@ -22,12 +22,34 @@ Categories include:
 import os
 import mimetypes
 from pathlib import Path
-from typing import Dict, Tuple, Optional
+from typing import BinaryIO, Dict, List, Tuple, Optional, Union
 import magic
 import logging
+import threading
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
+# libmagic and our signature checks only need the leading bytes of a file
+SNIFF_SIZE = 4096
+
+
+def _get_head(content: Union[bytes, bytearray, memoryview, BinaryIO]) -> bytes:
+    """
+    Return at most SNIFF_SIZE leading bytes of in-memory content or a stream
+
+    Streams are rewound to where they were so callers can still read the
+    full body afterwards.
+    """
+    if isinstance(content, (bytes, bytearray, memoryview)):
+        return bytes(content[:SNIFF_SIZE])
+
+    position = content.tell() if content.seekable() else None
+    head = content.read(SNIFF_SIZE)
+    if position is not None:
+        content.seek(position)
+    return head
+
 
 class SmartFolderClassifier:
     """
@@ -371,27 +393,59 @@ class SmartFolderClassifier:
 
     def __init__(self):
         """Initialize the smart folder classifier"""
+        self._build_indexes()
+        # Uploads repeat a small set of extension/MIME pairs; memoize the
+        # category match per instance
+        self._match_category = lru_cache(maxsize=1024)(self._find_category)
         logger.info("Smart Folder Classifier initialized")
 
-    def classify_file(self, filename: str, content: Optional[bytes] = None) -> Tuple[str, Dict[str, str]]:
+    def _build_indexes(self):
+        """
+        Precompute lookup tables used by classify_file
+
+        Builds an extension index ({'.jpg': 'photos', ...}) so extension
+        matching is one dict lookup instead of scanning every category's
+        extension list, and a MIME prefix index ({'image': 'photos',
+        'video': ...}) so the broad "same top-level type" fallback is a single
+        dict lookup instead of splitting every pattern on every call. In both,
+        the first category listing a key wins, matching FILE_CATEGORIES order.
+        """
+        self._extension_index: Dict[str, Tuple[int, str]] = {}
+        self._mime_patterns: List[Tuple[str, List[str]]] = []
+        self._mime_prefix_index: Dict[str, str] = {}
+        for position, (category_name, category_info) in enumerate(self.FILE_CATEGORIES.items()):
+            for extension in category_info['extensions']:
+                self._extension_index.setdefault(extension, (position, category_name))
+            self._mime_patterns.append((category_name, category_info['mime_patterns']))
+            for mime_pattern in category_info['mime_patterns']:
+                prefix = mime_pattern.partition('/')[0]
+                self._mime_prefix_index.setdefault(prefix, category_name)
+
+    def classify_file(self, filename: str,
+                      content: Optional[Union[bytes, BinaryIO]] = None) -> Tuple[str, Dict[str, str]]:
         """
         Classify a file into the most appropriate category
 
         Args:
             filename: Name of the file
-            content: Optional file content for magic byte detection
+            content: Optional file content (bytes or a readable stream) for
+                magic byte detection; only the first SNIFF_SIZE bytes are read
 
         Returns:
             Tuple of (category_name, category_info)
         """
-        file_ext = Path(filename).suffix.lower()
+        file_ext = os.path.splitext(filename)[1].lower()
+        if file_ext == '.':
+            # A trailing dot is no extension (as with Path.suffix)
+            file_ext = ''
 
         # Try MIME type detection if content provided
         mime_type = None
-        if content:
+        head = _get_head(content) if content is not None else b''
+        if head:
             try:
                 mime = magic.Magic(mime=True)
-                mime_type = mime.from_buffer(content)
+                mime_type = mime.from_buffer(head)
             except Exception as e:
                 logger.warning(f"Magic detection failed: {e}")
 
@@ -399,39 +453,66 @@ class SmartFolderClassifier:
         if not mime_type:
             mime_type, _ = mimetypes.guess_type(filename)
 
-        # Search through categories for best match
-        for category_name, category_info in self.FILE_CATEGORIES.items():
-            # Check extension match
-            if file_ext in category_info['extensions']:
-                return category_name, {
-                    'category': category_name,
-                    'description': category_info['description'],
-                    'matched_by': 'extension',
-                    'extension': file_ext,
-                    'mime_type': mime_type or 'unknown'
-                }
-
-            # Check MIME type match
-            if mime_type:
-                for mime_pattern in category_info['mime_patterns']:
-                    if mime_pattern in mime_type or mime_type.startswith(mime_pattern.split('/')[0]):
-                        return category_name, {
-                            'category': category_name,
-                            'description': category_info['description'],
-                            'matched_by': 'mime_type',
-                            'extension': file_ext,
-                            'mime_type': mime_type
-                        }
+        return self.classify_extension(file_ext, mime_type)
 
-        # Default to 'other' if no match found
-        return 'other', {
-            'category': 'other',
-            'description': 'Uncategorized files',
-            'matched_by': 'default',
+    def classify_extension(self, file_ext: str,
+                           mime_type: Optional[str] = None) -> Tuple[str, Dict[str, str]]:
+        """
+        Classify from an already extracted extension and optional MIME type
+
+        Fast path for callers that have the extension at hand; classify_file
+        derives both from the filename and content and then calls this.
+
+        Args:
+            file_ext: Lowercase extension including the dot (e.g. '.jpg')
+            mime_type: Optional detected MIME type
+
+        Returns:
+            Tuple of (category_name, category_info)
+        """
+        category_name, matched_by = self._match_category(file_ext, mime_type)
+        return category_name, {
+            'category': category_name,
+            'description': self.FILE_CATEGORIES[category_name]['description'],
+            'matched_by': matched_by,
             'extension': file_ext,
             'mime_type': mime_type or 'unknown'
         }
 
+    def _find_category(self, file_ext: str, mime_type: Optional[str]) -> Tuple[str, str]:
+        """
+        Match an extension and MIME type to a category
+
+        Returns:
+            Tuple of (category_name, matched_by)
+        """
+        # The first category, in FILE_CATEGORIES order, matching either the
+        # extension or the MIME type wins. A MIME match can only beat the
+        # extension match if it comes from an earlier category.
+        extension_position, extension_category = self._extension_index.get(
+            file_ext, (len(self._mime_patterns), None)
+        )
+
+        # Check MIME type match
+        if mime_type:
+            for category_name, mime_patterns in self._mime_patterns[:extension_position]:
+                for mime_pattern in mime_patterns:
+                    if mime_pattern in mime_type:
+                        return category_name, 'mime_type'
+
+        # Check extension match
+        if extension_category:
+            return extension_category, 'extension'
+
+        # Last resort: match on the top-level MIME type (e.g. any image/*)
+        if mime_type:
+            category_name = self._mime_prefix_index.get(mime_type.partition('/')[0])
+            if category_name:
+                return category_name, 'mime_type'
+
+        # Default to 'other' if no match found
+        return 'other', 'default'
+
     def get_folder_path(self, category: str, base_path: Path,
                        use_date_subfolders: bool = True) -> Path:
         """
@@ -499,11 +580,14 @@ class SmartFolderClassifier:
 
 # Global classifier instance
 _classifier_instance = None
+_init_lock = threading.Lock()
 
 
 def get_smart_classifier() -> SmartFolderClassifier:
     """Get singleton smart classifier instance"""
     global _classifier_instance
     if _classifier_instance is None:
-        _classifier_instance = SmartFolderClassifier()
+        with _init_lock:
+            if _classifier_instance is None:
+                _classifier_instance = SmartFolderClassifier()
     return _classifier_instance
@@ -11,17 +11,134 @@ Provides RESTful API endpoints for:
 
 import json
 import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import orjson
+from cachetools import TTLCache
+from django.core.serializers.json import DjangoJSONEncoder
 from django.http import JsonResponse, FileResponse, HttpResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
 from django.core.cache import cache
-from .admin_auth import require_admin, get_auth_manager
+from .admin_auth import _BEARER_PREFIX, require_admin, get_auth_manager
 from .smart_db_router import get_db_router
 from .media_storage import get_media_storage
 from .json_analyzer import analyze_json_for_database
 
 logger = logging.getLogger(__name__)
 
+# Process-wide singletons resolved once at import so views skip the getter on
+# every request. The database router stays lazy: constructing it connects to
+# MongoDB and builds indexes, which must not happen at URLconf import time.
+_AUTH = get_auth_manager()
+_MEDIA = get_media_storage()
+
+# Per-process L1 cache in front of Django's cache backend. Hot documents and
+# media metadata are served from memory without a backend round-trip; the
+# short TTL bounds how long a delete made by another worker stays invisible.
+_L1 = TTLCache(maxsize=1024, ttl=60)
+_L1_LOCK = threading.Lock()
+
+
+_JSON_DEFAULT = DjangoJSONEncoder().default
+
+
+def _json(obj, status=200):
+    """Serialize a response body with orjson (JsonResponse-compatible output)"""
+    return HttpResponse(
+        orjson.dumps(obj, default=_JSON_DEFAULT, option=orjson.OPT_NON_STR_KEYS),
+        content_type='application/json',
+        status=status
+    )
+
+
+def _cache_get(cache_key):
+    """Look up a key in the L1 cache, falling back to the shared cache"""
+    with _L1_LOCK:
+        value = _L1.get(cache_key)
+    if value is None:
+        value = cache.get(cache_key)
+        if value is not None:
+            with _L1_LOCK:
+                _L1[cache_key] = value
+    return value
+
+
+def _cache_set(cache_key, value, timeout=3600):
+    """Store a value in both the L1 cache and the shared cache"""
+    cache.set(cache_key, value, timeout=timeout)
+    with _L1_LOCK:
+        _L1[cache_key] = value
+
+
+def _cache_add(cache_key, value, timeout=3600):
+    """
+    Store a value in the shared cache only if the key is absent
+
+    Avoids a second backend write when an upload and a later read both try to
+    populate the same key. The L1 cache is always refreshed.
+    """
+    cache.add(cache_key, value, timeout=timeout)
+    with _L1_LOCK:
+        _L1[cache_key] = value
+
+
+def _cache_delete(*cache_keys):
+    """Remove keys from both the L1 cache and the shared cache"""
+    with _L1_LOCK:
+        for cache_key in cache_keys:
+            _L1.pop(cache_key, None)
+    cache.delete_many(cache_keys)
+
+
+# Statistics are polled often but change slowly. Entries are fresh for
+# STATS_CACHE_TIMEOUT seconds, then served stale for up to STATS_STALE_WINDOW
+# more while a single background refresh recomputes them. Uploads and
+# deletes drop the entry so the next request recomputes synchronously.
+STATS_CACHE_TIMEOUT = 30
+STATS_STALE_WINDOW = 300
+
+# One worker is enough: refreshes are single-flight per admin and cheap
+_STATS_REFRESHER = ThreadPoolExecutor(max_workers=1, thread_name_prefix='stats-refresh')
+
+
+# Listing endpoints are cached briefly per admin and query. Their keys embed
+# a per-admin version, so a write invalidates every cached listing at once.
+LIST_CACHE_TIMEOUT = 10
+
+
+def _stats_key(admin_id):
+    """Cache key for an admin's storage statistics"""
+    return f"stats_{admin_id}"
+
+
+def _admin_version(admin_id):
+    """Current version of an admin's data, bumped by every write"""
+    return cache.get_or_set(f"listver_{admin_id}", 1, timeout=None)
+
+
+def _list_key(admin_id, kind, *params):
+    """Cache key for an admin's listing, tied to the current list version"""
+    version = _admin_version(admin_id)
+    return f"list_{kind}_{admin_id}_v{version}_" + '_'.join(str(p) for p in params)
+
+
+def _invalidate_admin_views(admin_id, *cache_keys):
+    """
+    Drop an admin's cached statistics and listings after a write
+
+    Extra keys (e.g. the written document's own entry) are removed in the
+    same delete_many round-trip.
+    """
+    _cache_delete(_stats_key(admin_id), *cache_keys)
+    try:
+        cache.incr(f"listver_{admin_id}")
+    except ValueError:
+        # No version yet: nothing has been cached for this admin
+        pass
+
 
 # ============================================================================
 # Authentication Endpoints
@@ -38,7 +155,7 @@ def admin_login(request):
     Returns: {"token": "...", "admin_id": "..."}
     """
     try:
-        data = json.loads(request.body)
+        data = orjson.loads(request.body)
         username = data.get('username')
         password = data.get('password')
 
@@ -47,18 +164,17 @@ def admin_login(request):
                 'error': 'Username and password required'
             }, status=400)
 
-        auth_manager = get_auth_manager()
-        result = auth_manager.authenticate(username, password)
+        result = _AUTH.authenticate(username, password)
 
         if result['success']:
-            return JsonResponse(result)
+            return _json(result)
         else:
-            return JsonResponse(result, status=401)
+            return _json(result, status=401)
 
-    except json.JSONDecodeError:
+    except (json.JSONDecodeError, orjson.JSONDecodeError):
         return JsonResponse({'error': 'Invalid JSON'}, status=400)
     except Exception as e:
-        logger.error(f"Login error: {e}")
+        logger.error("Login error: %s", e)
         return JsonResponse({'error': 'Internal server error'}, status=500)
 
 
@@ -72,7 +188,7 @@ def admin_create(request):
     Body: {"username": "admin", "password": "password", "email": "admin@example.com"}
     """
     try:
-        data = json.loads(request.body)
+        data = orjson.loads(request.body)
         username = data.get('username')
         password = data.get('password')
         email = data.get('email')
@@ -82,18 +198,17 @@ def admin_create(request):
                 'error': 'Username and password required'
             }, status=400)
 
-        auth_manager = get_auth_manager()
-        result = auth_manager.create_admin(username, password, email)
+        result = _AUTH.create_admin(username, password, email)
 
         if result['success']:
-            return JsonResponse(result, status=201)
+            return _json(result, status=201)
         else:
-            return JsonResponse(result, status=400)
+            return _json(result, status=400)
 
-    except json.JSONDecodeError:
+    except (json.JSONDecodeError, orjson.JSONDecodeError):
         return JsonResponse({'error': 'Invalid JSON'}, status=400)
     except Exception as e:
-        logger.error(f"Admin creation error: {e}")
+        logger.error("Admin creation error: %s", e)
         return JsonResponse({'error': 'Internal server error'}, status=500)
 
 
@@ -109,15 +224,19 @@ def admin_logout(request, admin_id):
     """
     try:
         auth_header = request.META.get('HTTP_AUTHORIZATION', '')
-        token = auth_header[7:]  # Remove 'Bearer ' prefix
+        token = auth_header.removeprefix(_BEARER_PREFIX)
+
+        if token == auth_header:
+            return JsonResponse({
+                'error': 'Missing or invalid authorization header'
+            }, status=401)
 
-        auth_manager = get_auth_manager()
-        result = auth_manager.logout(token)
+        result = _AUTH.logout(token)
 
         return JsonResponse(result)
 
     except Exception as e:
-        logger.error(f"Logout error: {e}")
+        logger.error("Logout error: %s", e)
         return JsonResponse({'error': 'Internal server error'}, status=500)
 
 
@@ -139,7 +258,7 @@ def upload_json(request, admin_id):
     """
     try:
         # Parse JSON from request
-        json_data = json.loads(request.body)
+        json_data = orjson.loads(request.body)
 
         # Get optional tags from query params
         tags = request.GET.get('tags', '').split(',') if request.GET.get('tags') else None
@@ -150,20 +269,21 @@ def upload_json(request, admin_id):
 
         # Log decision
         logger.info(
-            f"JSON uploaded by {admin_id}: {result['doc_id']} -> "
-            f"{result['database_type'].upper()} (confidence: {result['confidence']})"
+            "JSON uploaded by %s: %s -> %s (confidence: %s)",
+            admin_id, result['doc_id'], result['database_type'].upper(), result['confidence']
         )
 
         # Cache result for fast retrieval
         cache_key = f"json_{result['doc_id']}"
-        cache.set(cache_key, result, timeout=3600)  # 1 hour cache
+        _cache_add(cache_key, result, timeout=3600)  # 1 hour cache
+        _invalidate_admin_views(admin_id)
 
-        return JsonResponse(result, status=201)
+        return _json(result, status=201)
 
-    except json.JSONDecodeError:
+    except (json.JSONDecodeError, orjson.JSONDecodeError):
         return JsonResponse({'error': 'Invalid JSON'}, status=400)
     except Exception as e:
-        logger.error(f"JSON upload error: {e}", exc_info=True)
+        logger.error("JSON upload error: %s", e, exc_info=True)
         return JsonResponse({'error': f'Upload failed: {str(e)}'}, status=500)
 
 
@@ -200,7 +320,7 @@ def upload_json_file(request, admin_id):
         db_router = get_db_router()
 
         if use_streaming:
-            logger.info(f"Large file detected ({file_size} bytes), using streaming upload")
+            logger.info("Large file detected (%d bytes), using streaming upload", file_size)
             result = db_router.analyze_and_route_streaming(uploaded_file.file, admin_id, tags)
         else:
             # Load entire file for smaller files
@@ -209,20 +329,21 @@ def upload_json_file(request, admin_id):
 
         # Log decision
         logger.info(
-            f"JSON file uploaded by {admin_id}: {result['doc_id']} -> "
-            f"{result['database_type'].upper()} (size: {file_size} bytes)"
+            "JSON file uploaded by %s: %s -> %s (size: %d bytes)",
+            admin_id, result['doc_id'], result['database_type'].upper(), file_size
         )
 
         # Cache result
         cache_key = f"json_{result['doc_id']}"
-        cache.set(cache_key, result, timeout=3600)
+        _cache_add(cache_key, result, timeout=3600)
+        _invalidate_admin_views(admin_id)
 
         return JsonResponse(result, status=201)
 
     except json.JSONDecodeError:
         return JsonResponse({'error': 'Invalid JSON in file'}, status=400)
     except Exception as e:
-        logger.error(f"JSON file upload error: {e}", exc_info=True)
+        logger.error("JSON file upload error: %s", e, exc_info=True)
         return JsonResponse({'error': f'Upload failed: {str(e)}'}, status=500)
 
 
@@ -239,12 +360,12 @@ def analyze_json(request, admin_id):
     Returns: Analysis result without storage
     """
     try:
-        json_data = json.loads(request.body)
+        json_data = orjson.loads(request.body)
 
         # Analyze without storing
         analysis = analyze_json_for_database(json_data)
 
-        return JsonResponse({
+        return _json({
             'recommended_db': analysis.recommended_db,
             'confidence': analysis.confidence,
             'reasons': analysis.reasons,
@@ -252,10 +373,10 @@ def analyze_json(request, admin_id):
             'schema_info': analysis.schema_info
         })
 
-    except json.JSONDecodeError:
+    except (json.JSONDecodeError, orjson.JSONDecodeError):
         return JsonResponse({'error': 'Invalid JSON'}, status=400)
     except Exception as e:
-        logger.error(f"JSON analysis error: {e}")
+        logger.error("JSON analysis error: %s", e)
         return JsonResponse({'error': 'Analysis failed'}, status=500)
 
 
@@ -283,7 +404,7 @@ def upload_media(request, admin_id):
         uploaded_file = request.FILES['file']
 
         # Store media
-        media_storage = get_media_storage()
+        media_storage = _MEDIA
         result = media_storage.store_media(
             uploaded_file.file,
             uploaded_file.name,
@@ -292,18 +413,19 @@ def upload_media(request, admin_id):
 
         # Log upload
         logger.info(
-            f"Media uploaded by {admin_id}: {result['file_id']} "
-            f"({result['file_type']}, {result['file_size']} bytes)"
+            "Media uploaded by %s: %s (%s, %d bytes)",
+            admin_id, result['file_id'], result['file_type'], result['file_size']
         )
 
         # Cache result
         cache_key = f"media_{result['file_id']}"
-        cache.set(cache_key, result, timeout=3600)
+        _cache_set(cache_key, result, timeout=3600)
+        _invalidate_admin_views(admin_id)
 
         return JsonResponse(result, status=201)
 
     except Exception as e:
-        logger.error(f"Media upload error: {e}", exc_info=True)
+        logger.error("Media upload error: %s", e, exc_info=True)
         return JsonResponse({'error': f'Upload failed: {str(e)}'}, status=500)
 
 
@@ -325,10 +447,10 @@ def retrieve_json(request, doc_id, admin_id):
     try:
         # Check cache first
         cache_key = f"json_{doc_id}"
-        cached_result = cache.get(cache_key)
+        cached_result = _cache_get(cache_key)
 
         if cached_result:
-            logger.info(f"Cache hit for {doc_id}")
+            logger.info("Cache hit for %s", doc_id)
             return JsonResponse({
                 'cached': True,
                 **cached_result
@@ -342,9 +464,9 @@ def retrieve_json(request, doc_id, admin_id):
             return JsonResponse({'error': 'Document not found or unauthorized'}, status=404)
 
         # Cache for next time
-        cache.set(cache_key, result, timeout=3600)
+        _cache_add(cache_key, result, timeout=3600)
 
-        logger.info(f"Retrieved {doc_id} from database")
+        logger.info("Retrieved %s from database", doc_id)
 
         return JsonResponse({
             'cached': False,
@@ -352,7 +474,7 @@ def retrieve_json(request, doc_id, admin_id):
         })
 
     except Exception as e:
-        logger.error(f"Retrieval error: {e}")
+        logger.error("Retrieval error: %s", e)
         return JsonResponse({'error': 'Retrieval failed'}, status=500)
 
 
@@ -430,14 +552,14 @@ def retrieve_json_range(request, doc_id, admin_id):
         if fields:
             response['range_info']['selected_fields'] = fields
 
-        logger.info(f"Retrieved range for {doc_id}: offset={offset}, limit={limit}")
+        logger.info("Retrieved range for %s: offset=%s, limit=%s", doc_id, offset, limit)
 
         return JsonResponse(response)
 
     except ValueError as e:
         return JsonResponse({'error': f'Invalid offset or limit parameter: {str(e)}'}, status=400)
     except Exception as e:
-        logger.error(f"Range retrieval error: {e}", exc_info=True)
+        logger.error("Range retrieval error: %s", e, exc_info=True)
         return JsonResponse({'error': f'Range retrieval failed: {str(e)}'}, status=500)
 
 
@@ -456,31 +578,44 @@ def retrieve_media(request, file_id, admin_id):
     try:
         thumbnail_size = request.GET.get('thumbnail')
 
-        # Check cache for file info
-        cache_key = f"media_{file_id}"
+        # Check cache for file info (metadata only, never file bytes)
+        cache_key = f"media_info_{admin_id}_{file_id}"
         if thumbnail_size:
             cache_key += f"_{thumbnail_size}"
 
-        # Retrieve file
-        media_storage = get_media_storage()
-        file_info = media_storage.retrieve_media(file_id, admin_id, thumbnail_size)
+        file_info = _cache_get(cache_key)
 
         if not file_info:
-            return JsonResponse({'error': 'File not found or unauthorized'}, status=404)
+            # Locate file on disk
+            media_storage = _MEDIA
+            file_info = media_storage.retrieve_media(file_id, admin_id, thumbnail_size)
 
-        # Return file
+            if not file_info:
+                return JsonResponse({'error': 'File not found or unauthorized'}, status=404)
+
+            _cache_add(cache_key, file_info, timeout=3600)
+
+        # Return file. An unbuffered handle lets the WSGI server's
+        # wsgi.file_wrapper hand the descriptor straight to sendfile(2).
+        file_handle = open(file_info['file_path'], 'rb', buffering=0)
         response = FileResponse(
-            open(file_info['file_path'], 'rb'),
-            content_type='application/octet-stream'
+            file_handle,
+            as_attachment=False,
+            filename=file_info['filename'],
+            content_type=file_info.get('mime_type', 'application/octet-stream')
         )
-        response['Content-Disposition'] = f'inline; filename="{file_info["filename"]}"'
+        response['Content-Length'] = os.fstat(file_handle.fileno()).st_size
 
-        logger.info(f"Retrieved media {file_id} (thumbnail={thumbnail_size})")
+        logger.info("Retrieved media %s (thumbnail=%s)", file_id, thumbnail_size)
 
         return response
 
+    except FileNotFoundError:
+        # Cached metadata points at a file deleted by another worker
+        _cache_delete(cache_key)
+        return JsonResponse({'error': 'File not found or unauthorized'}, status=404)
     except Exception as e:
-        logger.error(f"Media retrieval error: {e}")
+        logger.error("Media retrieval error: %s", e)
         return JsonResponse({'error': 'Retrieval failed'}, status=500)
 
 
@@ -503,16 +638,22 @@ def list_json_documents(request, admin_id):
         db_type = request.GET.get('db_type')
         limit = int(request.GET.get('limit', 100))
 
-        db_router = get_db_router()
-        documents = db_router.list_documents(admin_id, db_type, limit)
+        cache_key = _list_key(admin_id, 'json', db_type, limit)
+        payload = cache.get(cache_key)
 
-        return JsonResponse({
-            'count': len(documents),
-            'documents': documents
-        })
+        if payload is None:
+            db_router = get_db_router()
+            documents = db_router.list_documents(admin_id, db_type, limit)
+            payload = {
+                'count': len(documents),
+                'documents': documents
+            }
+            cache.set(cache_key, payload, timeout=LIST_CACHE_TIMEOUT)
+
+        return JsonResponse(payload)
 
     except Exception as e:
-        logger.error(f"List documents error: {e}")
+        logger.error("List documents error: %s", e)
         return JsonResponse({'error': 'List failed'}, status=500)
 
 
@@ -531,16 +672,22 @@ def list_media_files(request, admin_id):
         file_type = request.GET.get('file_type')
         limit = int(request.GET.get('limit', 100))
 
-        media_storage = get_media_storage()
-        files = media_storage.list_media(admin_id, file_type, limit)
+        cache_key = _list_key(admin_id, 'media', file_type, limit)
+        payload = cache.get(cache_key)
 
-        return JsonResponse({
-            'count': len(files),
-            'files': files
-        })
+        if payload is None:
+            media_storage = _MEDIA
+            files = media_storage.list_media(admin_id, file_type, limit)
+            payload = {
+                'count': len(files),
+                'files': files
+            }
+            cache.set(cache_key, payload, timeout=LIST_CACHE_TIMEOUT)
+
+        return JsonResponse(payload)
 
     except Exception as e:
-        logger.error(f"List media error: {e}")
+        logger.error("List media error: %s", e)
         return JsonResponse({'error': 'List failed'}, status=500)
 
 
@@ -565,14 +712,68 @@ def delete_json(request, doc_id, admin_id):
         if success:
             # Clear cache
             cache_key = f"json_{doc_id}"
-            cache.delete(cache_key)
+            _invalidate_admin_views(admin_id, cache_key)
 
             return JsonResponse({'success': True, 'message': 'Document deleted'})
         else:
             return JsonResponse({'error': 'Delete failed or unauthorized'}, status=404)
 
     except Exception as e:
-        logger.error(f"Delete error: {e}")
+        logger.error("Delete error: %s", e)
+        return JsonResponse({'error': 'Delete failed'}, status=500)
+
+
+@csrf_exempt
+@require_http_methods(["POST"])
+@require_admin
+def delete_json_bulk(request, admin_id):
+    """
+    Delete several JSON documents at once
+
+    POST /api/delete/json/bulk
+    Header: Authorization: Bearer <token>
+    Body: {"ids": ["<doc_id>", ...]}
+    Returns: Deleted IDs and IDs that were not found or not owned
+    """
+    try:
+        payload = orjson.loads(request.body)
+        doc_ids = payload.get('ids') if isinstance(payload, dict) else None
+
+        if not isinstance(doc_ids, list) or not doc_ids or \
+                not all(isinstance(doc_id, str) for doc_id in doc_ids):
+            return JsonResponse({'error': 'ids must be a non-empty list of document IDs'}, status=400)
+
+        doc_ids = list(dict.fromkeys(doc_ids))
+
+        db_router = get_db_router()
+        deleted, failed = db_router.delete_documents(doc_ids, admin_id)
+
+        # Clear cache in one round-trip for the whole batch; failed ids may
+        # have lost their document even though the delete didn't finish
+        if deleted or failed:
+            _invalidate_admin_views(
+                admin_id, *(f"json_{doc_id}" for doc_id in deleted + failed)
+            )
+
+        if failed:
+            return JsonResponse({
+                'error': 'Delete failed',
+                'deleted': deleted,
+                'failed': failed
+            }, status=500)
+
+        deleted_set = set(deleted)
+        return JsonResponse({
+            'success': True,
+            'deleted': deleted,
+            'not_found': [doc_id for doc_id in doc_ids if doc_id not in deleted_set],
+            'count': len(deleted)
+        })
+
+    except (json.JSONDecodeError, orjson.JSONDecodeError):
+        return JsonResponse({'error': 'Invalid JSON'}, status=400)
+    except Exception as e:
+        logger.error("Bulk delete error: %s", e)
         return JsonResponse({'error': 'Delete failed'}, status=500)
 
 
@@ -587,20 +788,25 @@ def delete_media(request, file_id, admin_id):
     Header: Authorization: Bearer <token>
     """
     try:
-        media_storage = get_media_storage()
+        media_storage = _MEDIA
         success = media_storage.delete_media(file_id, admin_id)
 
         if success:
             # Clear cache
-            cache_key = f"media_{file_id}"
-            cache.delete(cache_key)
+            info_key = f"media_info_{admin_id}_{file_id}"
+            _invalidate_admin_views(
+                admin_id,
+                f"media_{file_id}",
+                info_key,
+                *(f"{info_key}_{size}" for size in media_storage.THUMBNAIL_SIZES)
+            )
 
             return JsonResponse({'success': True, 'message': 'File deleted'})
         else:
             return JsonResponse({'error': 'Delete failed or unauthorized'}, status=404)
 
     except Exception as e:
-        logger.error(f"Delete media error: {e}")
+        logger.error("Delete media error: %s", e)
         return JsonResponse({'error': 'Delete failed'}, status=500)
 
 
@@ -608,6 +814,67 @@ def delete_media(request, file_id, admin_id):
 # Statistics and Monitoring
 # ============================================================================
 
+def _compute_statistics(admin_id):
+    """Build the statistics payload from document and media aggregates"""
+    media_storage = _MEDIA
+
+    # Counts come from aggregates, not from listing every document/file
+    doc_counts = get_db_router().count_documents(admin_id)
+    media = media_storage.stats(admin_id)
+
+    return {
+        'admin_id': admin_id,
+        'json_documents': {
+            'total': doc_counts['sql'] + doc_counts['nosql'],
+            'sql': doc_counts['sql'],
+            'nosql': doc_counts['nosql']
+        },
+        'media_files': {
+            'total': media['total'],
+            'images': media['images'],
+            'videos': media['videos'],
+            'audio': media['audio'],
+            'documents': media['documents'],
+            'total_size_bytes': media['total_size_bytes'],
+            'total_size_human': media_storage._human_readable_size(media['total_size_bytes'])
+        }
+    }
+
+
+def _refresh_statistics(admin_id):
+    """
+    Recompute statistics and cache them with their freshness deadline
+
+    A write during the computation bumps the admin's version; the result
+    may predate it, so it is returned but not cached.
+    """
+    version = _admin_version(admin_id)
+    stats = _compute_statistics(admin_id)
+    if cache.get(f"listver_{admin_id}") == version:
+        cache.set(
+            _stats_key(admin_id),
+            (stats, time.time() + STATS_CACHE_TIMEOUT),
+            timeout=STATS_CACHE_TIMEOUT + STATS_STALE_WINDOW
+        )
+    return stats
+
+
+def _background_refresh_statistics(admin_id):
+    """Refresh task run on the stats worker; releases the single-flight lock"""
+    try:
+        _refresh_statistics(admin_id)
+    except Exception as e:
+        logger.error("Statistics refresh error: %s", e)
+    finally:
+        cache.delete(f"{_stats_key(admin_id)}_refreshing")
+
+
+def _schedule_stats_refresh(admin_id):
+    """Queue a background refresh unless one is already running for this admin"""
+    if cache.add(f"{_stats_key(admin_id)}_refreshing", True, timeout=STATS_CACHE_TIMEOUT):
+        _STATS_REFRESHER.submit(_background_refresh_statistics, admin_id)
+
+
 @csrf_exempt
 @require_http_methods(["GET"])
 @require_admin
@@ -620,45 +887,19 @@ def get_statistics(request, admin_id):
     Returns: Statistics about stored data
     """
     try:
-        db_router = get_db_router()
-        media_storage = get_media_storage()
-
-        # Get document counts
-        sql_docs = db_router.list_documents(admin_id, 'sql', limit=10000)
-        nosql_docs = db_router.list_documents(admin_id, 'nosql', limit=10000)
-
-        # Get media counts
-        all_media = media_storage.list_media(admin_id, limit=10000)
-        images = [f for f in all_media if f['file_type'] == 'images']
-        videos = [f for f in all_media if f['file_type'] == 'videos']
-        audio = [f for f in all_media if f['file_type'] == 'audio']
-        documents = [f for f in all_media if f['file_type'] == 'documents']
-
-        # Calculate total storage
-        total_media_size = sum(f['size'] for f in all_media)
-
-        stats = {
-            'admin_id': admin_id,
-            'json_documents': {
-                'total': len(sql_docs) + len(nosql_docs),
-                'sql': len(sql_docs),
-                'nosql': len(nosql_docs)
-            },
-            'media_files': {
-                'total': len(all_media),
-                'images': len(images),
-                'videos': len(videos),
-                'audio': len(audio),
-                'documents': len(documents),
-                'total_size_bytes': total_media_size,
-                'total_size_human': media_storage._human_readable_size(total_media_size)
-            }
-        }
+        cached = cache.get(_stats_key(admin_id))
+
+        if cached is not None:
+            stats, fresh_until = cached
+            if time.time() >= fresh_until:
+                # Serve the stale value now and refresh it in the background
+                _schedule_stats_refresh(admin_id)
+            return JsonResponse(stats)
 
-        return JsonResponse(stats)
+        return JsonResponse(_refresh_statistics(admin_id))
 
     except Exception as e:
-        logger.error(f"Statistics error: {e}")
+        logger.error("Statistics error: %s", e)
         return JsonResponse({'error': 'Failed to get statistics'}, status=500)
 
 
@@ -707,7 +948,7 @@ def get_document_schema(request, admin_id):
             }, status=404)
 
     except Exception as e:
-        logger.error(f"Schema retrieval error: {e}", exc_info=True)
+        logger.error("Schema retrieval error: %s", e, exc_info=True)
         return JsonResponse({'error': f'Failed to get schema: {str(e)}'}, status=500)
 
 
@@ -831,7 +1072,7 @@ def retrieve_schemas(request, admin_id):
             'error': 'Invalid JSON in request body'
         }, status=400)
     except Exception as e:
-        logger.error(f"Schema retrieval error: {e}", exc_info=True)
+        logger.error("Schema retrieval error: %s", e, exc_info=True)
         return JsonResponse({
             'success': False,
             'error': str(e)
@@ -867,7 +1108,7 @@ def download_schema(request, schema_id, admin_id):
             )
             response['Content-Disposition'] = f'attachment; filename="{result["filename"]}"'
 
-            logger.info(f"Schema {schema_id} downloaded by {admin_id}")
+            logger.info("Schema %s downloaded by %s", schema_id, admin_id)
 
             return response
         else:
@@ -879,7 +1120,7 @@ def download_schema(request, schema_id, admin_id):
             'error': 'Invalid schema ID'
         }, status=400)
     except Exception as e:
-        logger.error(f"Schema download error: {e}", exc_info=True)
+        logger.error("Schema download error: %s", e, exc_info=True)
         return JsonResponse({
             'success': False,
             'error': str(e)
@@ -923,7 +1164,7 @@ def view_schema(request, schema_id, admin_id):
             'error': 'Invalid schema ID'
         }, status=400)
     except Exception as e:
-        logger.error(f"Schema view error: {e}", exc_info=True)
+        logger.error("Schema view error: %s", e, exc_info=True)
         return JsonResponse({
             'success': False,
             'error': str(e)
@@ -962,7 +1203,7 @@ def schema_statistics(request, admin_id):
         return JsonResponse(result)
 
     except Exception as e:
-        logger.error(f"Schema statistics error: {e}", exc_info=True)
+        logger.error("Schema statistics error: %s", e, exc_info=True)
         return JsonResponse({
             'success': False,
             'error': str(e)
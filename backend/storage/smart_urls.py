@@ -39,6 +39,7 @@ urlpatterns = [
     path('list/media', views.list_media_files, name='list_media'),
 
     # Delete endpoints
+    path('delete/json/bulk', views.delete_json_bulk, name='delete_json_bulk'),
     path('delete/json/<str:doc_id>', views.delete_json, name='delete_json'),
     path('delete/media/<str:file_id>', views.delete_media, name='delete_media'),
 
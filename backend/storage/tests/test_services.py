@@ -5,6 +5,8 @@ Test chunking, embeddings, and other services.
 
 from django.test import TestCase
 from storage.chunking_service import ChunkingService
+from storage.smart_folder_classifier import SmartFolderClassifier
+from storage.trie_fuzzy_search import AdaptiveTrieFuzzySearch
 import tempfile
 import os
 
@@ -151,3 +153,83 @@ class EmbeddingsServiceTest(TestCase):
         """Test batch embedding generation."""
         # Placeholder test
         pass
+
+
+class TrieFuzzySearchTest(TestCase):
+    """Test AdaptiveTrieFuzzySearch prefix and fuzzy matching."""
+
+    def setUp(self):
+        """Set up a small index."""
+        self.engine = AdaptiveTrieFuzzySearch()
+        files = [
+            (1, 'machine_learning_notes.pdf', 'documents', '.pdf'),
+            (2, 'vacation-photo.jpg', 'images', '.jpg'),
+            (3, 'budget report 2024.xlsx', 'documents', '.xlsx'),
+        ]
+        for file_id, name, file_type, extension in files:
+            self.engine.index_file({
+                'id': file_id,
+                'name': name,
+                'type': file_type,
+                'size': 1024,
+                'extension': extension,
+            })
+
+    def test_exact_prefix_search(self):
+        """Test prefix lookup returns every file under the prefix."""
+        self.assertEqual(set(self.engine.exact_prefix_search('mach')), {1})
+        self.assertEqual(set(self.engine.exact_prefix_search('doc')), {1, 3})
+        self.assertEqual(self.engine.exact_prefix_search('zzz'), [])
+
+    def test_prefix_search_splits_compressed_edges(self):
+        """Test prefixes ending inside an edge and words splitting one."""
+        self.engine.insert_word('machinery', 4)
+        self.assertEqual(set(self.engine.exact_prefix_search('machi')), {1, 4})
+        self.assertEqual(set(self.engine.exact_prefix_search('machiner')), {4})
+        self.assertEqual(self.engine.exact_prefix_search('machx'), [])
+
+    def test_fuzzy_search_handles_typos(self):
+        """Test substitutions, insertions and deletions within distance."""
+        self.assertIn(1, self.engine.fuzzy_search_trie('machne', max_distance=1))
+        self.assertIn(2, self.engine.fuzzy_search_trie('vacaton', max_distance=1))
+        self.assertIn(3, self.engine.fuzzy_search_trie('bugdet', max_distance=2))
+
+    def test_fuzzy_search_respects_distance(self):
+        """Test words beyond the edit distance are not matched."""
+        self.assertNotIn(2, self.engine.fuzzy_search_trie('machine', max_distance=2))
+        self.assertEqual(self.engine.fuzzy_search_trie('qqqqqqq', max_distance=1), [])
+
+    def test_levenshtein_distance(self):
+        """Test bounded edit distance."""
+        self.assertEqual(self.engine.levenshtein_distance('kitten', 'sitting'), 3)
+        self.assertEqual(self.engine.levenshtein_distance('photo', 'photo'), 0)
+        self.assertEqual(self.engine.levenshtein_distance('photo', 'fotograph', max_distance=2), 3)
+
+
+class SmartFolderClassifierTest(TestCase):
+    """Test SmartFolderClassifier category matching."""
+
+    def setUp(self):
+        """Set up the classifier."""
+        self.classifier = SmartFolderClassifier()
+
+    def test_extension_beats_mime_prefix_fallback(self):
+        """Test a known extension wins over a broad MIME prefix match."""
+        category, info = self.classifier.classify_extension('.pdf', 'application/pdf')
+
+        self.assertEqual(category, 'pdf')
+        self.assertEqual(info['matched_by'], 'extension')
+
+    def test_mime_prefix_fallback(self):
+        """Test an unknown extension falls back to the top-level MIME type."""
+        category, info = self.classifier.classify_extension('.xyz', 'image/foo')
+
+        self.assertEqual(category, 'photos')
+        self.assertEqual(info['matched_by'], 'mime_type')
+
+    def test_unknown_file_defaults_to_other(self):
+        """Test no extension or MIME match classifies as other."""
+        category, info = self.classifier.classify_extension('.xyz')
+
+        self.assertEqual(category, 'other')
+        self.assertEqual(info['matched_by'], 'default')
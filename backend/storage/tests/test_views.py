@@ -7,7 +7,8 @@ from django.test import TestCase, Client
 from django.urls import reverse
 from rest_framework.test import APITestCase, APIClient
 from rest_framework import status
-from storage.models import FileSearchStore, MediaFile
+from storage.models import FileSearchStore, JSONDataStore, MediaFile, ReindexTask
+from unittest import mock
 import json
 
 
@@ -120,6 +121,145 @@ class MediaFileAPITest(APITestCase):
         self.assertEqual(len(response.data), 0)
 
 
+class ReindexAPITest(APITestCase):
+    """Test background RAG reindex endpoints."""
+
+    def setUp(self):
+        """Set up test client."""
+        self.client = APIClient()
+
+    def test_reindex_all_starts_task(self):
+        """Test starting a reindex records a pending task."""
+        with mock.patch('storage.views._REINDEXER') as reindexer:
+            response = self.client.post(reverse('reindex-all'))
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        task = ReindexTask.objects.get(task_id=response.data['task_id'])
+        self.assertEqual(task.state, 'PENDING')
+        self.assertTrue(task.is_running)
+        reindexer.submit.assert_called_once()
+
+    def test_reindex_all_returns_running_task(self):
+        """Test a second reindex returns the running task instead of starting one."""
+        running = ReindexTask.objects.create(task_id='a' * 32, state='PROGRESS')
+
+        with mock.patch('storage.views._REINDEXER') as reindexer:
+            response = self.client.post(reverse('reindex-all'))
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(response.data['task_id'], running.task_id)
+        self.assertEqual(response.data['status'], 'already running')
+        self.assertEqual(ReindexTask.objects.count(), 1)
+        reindexer.submit.assert_not_called()
+
+    def test_reindex_status_progress(self):
+        """Test polling a running task reports its progress."""
+        ReindexTask.objects.create(task_id='b' * 32, state='PROGRESS', current=3, total=10)
+
+        url = reverse('reindex-status', kwargs={'task_id': 'b' * 32})
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['state'], 'PROGRESS')
+        self.assertEqual(response.data['current'], 3)
+        self.assertEqual(response.data['total'], 10)
+
+    def test_reindex_status_unknown_task(self):
+        """Test polling an unknown task id returns 404."""
+        url = reverse('reindex-status', kwargs={'task_id': 'missing'})
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class JSONDataQueryStreamTest(APITestCase):
+    """Test streaming JSON data store queries."""
+
+    def setUp(self):
+        """Set up test client and data."""
+        self.client = APIClient()
+
+        self.store = JSONDataStore.objects.create(
+            name='test-data',
+            database_type='SQL',
+            confidence_score=90,
+            table_name='test_data',
+        )
+        self.url = reverse('jsonstore-query', kwargs={'pk': self.store.pk})
+
+    def test_stream_emits_one_line_per_row(self):
+        """Test ?stream=1 returns one JSON document per line."""
+        rows = [{'id': 1, 'name': 'a'}, {'id': 2, 'name': 'b'}]
+
+        with mock.patch('storage.views.db_manager.iter_postgresql', return_value=iter(rows)):
+            response = self.client.get(self.url, {'stream': '1'})
+            body = b''.join(response.streaming_content)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        lines = body.decode().splitlines()
+        self.assertEqual([json.loads(line) for line in lines], rows)
+
+    def test_stream_query_error_returns_500(self):
+        """Test a query that fails before the first row is not streamed."""
+        def failing_rows():
+            raise RuntimeError('relation does not exist')
+            yield
+
+        with mock.patch('storage.views.db_manager.iter_postgresql', return_value=failing_rows()):
+            response = self.client.get(self.url, {'stream': '1'})
+
+        self.assertEqual(response.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+class BulkDeleteJSONTest(TestCase):
+    """Test bulk deletion of smart-upload JSON documents."""
+
+    def setUp(self):
+        """Set up test client with an authenticated admin."""
+        self.client = Client(HTTP_AUTHORIZATION='Bearer test-token')
+        self.url = reverse('delete_json_bulk')
+
+        auth_manager = mock.Mock()
+        auth_manager.validate_token.return_value = 'admin-1'
+        patcher = mock.patch('storage.admin_auth.get_auth_manager', return_value=auth_manager)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.router = mock.Mock()
+        patcher = mock.patch('storage.smart_upload_views.get_db_router', return_value=self.router)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_unowned_ids_reported_not_found(self):
+        """Test ids the admin doesn't own are listed under not_found."""
+        self.router.delete_documents.return_value = (['doc-1'], [])
+
+        response = self.client.post(
+            self.url, json.dumps({'ids': ['doc-1', 'doc-2']}),
+            content_type='application/json'
+        )
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data['deleted'], ['doc-1'])
+        self.assertEqual(data['not_found'], ['doc-2'])
+        self.router.delete_documents.assert_called_once_with(['doc-1', 'doc-2'], 'admin-1')
+
+    def test_store_failure_returns_500(self):
+        """Test a failed store delete isn't reported as not found."""
+        self.router.delete_documents.return_value = (['doc-1'], ['doc-2'])
+
+        response = self.client.post(
+            self.url, json.dumps({'ids': ['doc-1', 'doc-2']}),
+            content_type='application/json'
+        )
+
+        self.assertEqual(response.status_code, 500)
+        data = response.json()
+        self.assertEqual(data['deleted'], ['doc-1'])
+        self.assertEqual(data['failed'], ['doc-2'])
+
 class TemplateViewTest(TestCase):
     """Test template-based views."""
 
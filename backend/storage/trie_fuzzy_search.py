@@ -10,25 +10,133 @@ Features:
 - Advanced filtering capabilities
 """
 
+import heapq
+import os
+import pickle
 import re
+import sys
+from bisect import bisect_left
 from collections import defaultdict
+from functools import lru_cache
+from operator import itemgetter
 from datetime import datetime
 from typing import List, Dict, Any, Optional, Tuple
 import logging
 
+from .levenshtein_bp import bitap_lev
+
 logger = logging.getLogger(__name__)
 
+# Filename tokenisation, compiled once for every index_file call.
+# Delimiters keep Unicode \s so non-ASCII spaces still split words.
+_FILENAME_DELIMITERS = re.compile(r'[_\-\s\.]+')
+_ALNUM_RUN = re.compile(r'[a-z0-9]+', re.ASCII)
+
+# Advanced filter syntax (@type:, @ext:, @size:, @date:). Filter values are
+# ASCII, so re.ASCII keeps \w/\d on the fast path and stops \d accepting
+# non-ASCII digits that float()/strptime() would then reject.
+_FILTER_FLAGS = re.ASCII | re.IGNORECASE
+_TYPE_FILTER = re.compile(r'@type:(\w+)', _FILTER_FLAGS)
+_EXT_FILTER = re.compile(r'@ext:(\w+)', _FILTER_FLAGS)
+_SIZE_FILTER = re.compile(r'@size:([><])?(\d+\.?\d*)(kb|mb|gb)?', _FILTER_FLAGS)
+_DATE_FILTER = re.compile(r'@date:([><])?(\d{4}-\d{2}-\d{2})', _FILTER_FLAGS)
+
+# Base relevance by match type (exact > prefix > fuzzy > semantic)
+_MATCH_SCORES = {
+    'exact': 100,
+    'prefix': 80,
+    'fuzzy': 60,
+    'semantic': 40
+}
+
+# Ranks (score, file_id, match_type) tuples without a Python-level key call
+_BY_SCORE = itemgetter(0)
+
+# Metadata fields with few distinct values; interned so every indexed file
+# shares one string object per value instead of holding its own copy
+_INTERNED_FIELDS = ('type', 'extension', 'mime_type', 'category')
+
+# Bump when the layout written by AdaptiveTrieFuzzySearch.save() changes
+INDEX_FORMAT_VERSION = 2
+
 
 class TrieNode:
-    """Node in the Trie data structure."""
+    """
+    Node in the (radix) Trie data structure.
 
-    def __init__(self):
-        self.children = {}
+    Each node owns the label of the edge leading into it, and children are
+    keyed by the first character of their label. Chains of single-child
+    nodes are merged into one multi-character edge: along such a chain every
+    node would carry the same file references and frequency anyway.
+
+    Nodes use __slots__: an index holds one per distinct edge, and a
+    per-instance __dict__ would dominate their memory.
+    """
+
+    __slots__ = ('label', 'children', 'is_end_of_word', 'file_references', 'frequency')
+
+    def __init__(self, label: str = ''):
+        self.label = label
+        self.children = {}  # first char of label -> TrieNode
         self.is_end_of_word = False
-        self.file_references = []  # Files that match this prefix
+        self.file_references = []  # Files that match this prefix (sorted posting list)
         self.frequency = 0  # How often this path is traversed
 
 
+class LevenshteinAutomaton:
+    """
+    Lazily determinised Levenshtein automaton for one query word.
+
+    A state is the Wagner-Fischer row for the characters consumed so far,
+    with every cell clipped at max_distance + 1. Clipping keeps the state
+    space finite, so each (state, char) transition is computed once and
+    then answered from a dict - the DFA is built on demand while walking
+    the Trie instead of recomputing a DP row per edge.
+    """
+
+    def __init__(self, word: str, max_distance: int):
+        self.word = word
+        self.max_distance = max_distance
+        self._transitions = {}
+
+    def start(self) -> Tuple[int, ...]:
+        """Return the initial state (empty input)."""
+        cap = self.max_distance + 1
+        return tuple(min(i, cap) for i in range(len(self.word) + 1))
+
+    def step(self, state: Tuple[int, ...], char: str) -> Optional[Tuple[int, ...]]:
+        """Consume char; return the next state, or None if no match can follow."""
+        key = (state, char)
+        try:
+            return self._transitions[key]
+        except KeyError:
+            pass
+
+        cap = self.max_distance + 1
+        row = [min(state[0] + 1, cap)]
+        for j, word_char in enumerate(self.word, 1):
+            row.append(min(
+                row[j - 1] + 1,                         # insertion
+                state[j] + 1,                           # deletion
+                state[j - 1] + (word_char != char),     # substitution
+                cap
+            ))
+
+        next_state = tuple(row) if min(row) <= self.max_distance else None
+        self._transitions[key] = next_state
+        return next_state
+
+    def is_match(self, state: Tuple[int, ...]) -> bool:
+        """True if the consumed input is within max_distance of the word."""
+        return state[-1] <= self.max_distance
+
+
+@lru_cache(maxsize=256)
+def get_levenshtein_automaton(word: str, max_distance: int) -> LevenshteinAutomaton:
+    """Return a shared automaton so repeated queries reuse its transitions."""
+    return LevenshteinAutomaton(word, max_distance)
+
+
 class AdaptiveTrieFuzzySearch:
     """
     Market-ready Trie-based fuzzy search with machine learning adaptation.
@@ -130,17 +238,58 @@ class AdaptiveTrieFuzzySearch:
         """Insert a word into the Trie with file reference."""
         word = word.lower()
         node = self.root
+        pos = 0
+
+        while pos < len(word):
+            child = node.children.get(word[pos])
+
+            if child is None:
+                # No edge shares the next character: hang the rest of the word
+                # off this node as a single leaf edge
+                leaf = TrieNode(word[pos:])
+                leaf.is_end_of_word = True
+                leaf.frequency = 1
+                leaf.file_references.append(file_id)
+                node.children[word[pos]] = leaf
+                return
+
+            label = child.label
+            common = 1
+            limit = min(len(label), len(word) - pos)
+            while common < limit and label[common] == word[pos + common]:
+                common += 1
+
+            if common < len(label):
+                # Word diverges or ends inside the edge: split it
+                split = TrieNode(label[:common])
+                split.frequency = child.frequency
+                split.file_references = list(child.file_references)
+                child.label = label[common:]
+                split.children[child.label[0]] = child
+                node.children[word[pos]] = split
+                child = split
 
-        for char in word:
-            if char not in node.children:
-                node.children[char] = TrieNode()
-            node = node.children[char]
-            node.frequency += 1
-            if file_id not in node.file_references:
-                node.file_references.append(file_id)
+            child.frequency += 1
+            self._add_reference(child, file_id)
+
+            node = child
+            pos += common
 
         node.is_end_of_word = True
 
+    @staticmethod
+    def _add_reference(node: TrieNode, file_id: int):
+        """Add file_id to the node's sorted posting list."""
+        # Ids usually arrive in ascending order, so this is an append;
+        # re-indexing an old file is a binary search
+        refs = node.file_references
+        if not refs or refs[-1] < file_id:
+            refs.append(file_id)
+        else:
+            i = bisect_left(refs, file_id)
+            if i == len(refs) or refs[i] != file_id:
+                refs.insert(i, file_id)
+
     def index_file(self, file_data: Dict[str, Any]):
         """
         Index a file for searching.
@@ -159,6 +308,10 @@ class AdaptiveTrieFuzzySearch:
                 }
         """
         file_id = file_data['id']
+        for field in _INTERNED_FIELDS:
+            value = file_data.get(field)
+            if isinstance(value, str):
+                file_data[field] = sys.intern(value)
         self.files_index[file_id] = file_data
 
         # Index filename with better word extraction
@@ -167,42 +320,46 @@ class AdaptiveTrieFuzzySearch:
 
         # Split on multiple delimiters: spaces, underscores, hyphens, dots
         # This makes "My_girl.mp4" → ["my", "girl", "mp4"]
-        words = re.split(r'[_\-\s\.]+', filename_lower)
-        words = [w for w in words if w]  # Remove empty strings
+        words = [w for w in _FILENAME_DELIMITERS.split(filename_lower) if w]
 
-        for word in words:
-            if len(word) > 0:
-                self.insert_word(word, file_id)
+        # Collect every term once so repeated words, tags or extensions
+        # don't walk the Trie again
+        terms = set(words)
 
-        # Also extract alphanumeric sequences (fallback)
-        alpha_words = re.findall(r'[a-z0-9]+', filename_lower)
-        for word in alpha_words:
-            if len(word) > 0 and word not in words:
-                self.insert_word(word, file_id)
+        # Alphanumeric runs (fallback) come from the same tokens: delimiters
+        # are never alphanumeric, so no second scan of the filename is needed
+        alpha_words = []
+        for word in words:
+            if word.isascii() and word.isalnum():
+                alpha_words.append(word)
+            else:
+                alpha_words.extend(_ALNUM_RUN.findall(word))
+        terms.update(alpha_words)
 
         # Index full filename (without special chars)
-        clean_filename = re.sub(r'[^a-z0-9]', '', filename_lower)
-        if clean_filename:
-            self.insert_word(clean_filename, file_id)
+        terms.add(''.join(alpha_words))
 
         # Index file type
         if file_data.get('type'):
-            self.insert_word(file_data['type'].lower(), file_id)
+            terms.add(file_data['type'].lower())
 
         # Index extension
         if file_data.get('extension'):
-            ext = file_data['extension'].lower().replace('.', '')
-            if ext:
-                self.insert_word(ext, file_id)
+            terms.add(file_data['extension'].lower().replace('.', ''))
 
         # Index tags
-        for tag in file_data.get('tags', []):
-            self.insert_word(tag.lower(), file_id)
+        terms.update(tag.lower() for tag in file_data.get('tags', []))
+
+        terms.discard('')
+        for term in terms:
+            self.insert_word(term, file_id)
 
     def levenshtein_distance(self, s1: str, s2: str, max_distance: int = 3) -> int:
         """
         Calculate Levenshtein distance with early termination.
 
+        Uses the bit-parallel kernel from levenshtein_bp.
+
         Args:
             s1: First string
             s2: Second string
@@ -211,42 +368,17 @@ class AdaptiveTrieFuzzySearch:
         Returns:
             Edit distance or max_distance + 1 if too far
         """
-        if abs(len(s1) - len(s2)) > max_distance:
-            return max_distance + 1
-
-        if len(s1) < len(s2):
-            s1, s2 = s2, s1
-
-        if len(s2) == 0:
-            return len(s1)
-
-        previous_row = range(len(s2) + 1)
-
-        for i, c1 in enumerate(s1):
-            current_row = [i + 1]
-            min_in_row = i + 1
-
-            for j, c2 in enumerate(s2):
-                insertions = previous_row[j + 1] + 1
-                deletions = current_row[j] + 1
-                substitutions = previous_row[j] + (c1 != c2)
-
-                current_value = min(insertions, deletions, substitutions)
-                current_row.append(current_value)
-                min_in_row = min(min_in_row, current_value)
-
-            # Early termination
-            if min_in_row > max_distance:
-                return max_distance + 1
-
-            previous_row = current_row
-
-        return previous_row[-1]
+        # Bit-parallel (Myers) kernel: one column update per character
+        return bitap_lev(s1, s2, max_distance)
 
     def fuzzy_search_trie(self, prefix: str, max_distance: int = 2) -> List[int]:
         """
         Fuzzy search using Trie with Levenshtein distance.
 
+        Intersects a Levenshtein automaton for the query with the Trie: each
+        edge is a single memoised state transition, and whole subtrees are
+        pruned as soon as the automaton has no live state.
+
         Args:
             prefix: Search query
             max_distance: Maximum edit distance allowed
@@ -254,49 +386,61 @@ class AdaptiveTrieFuzzySearch:
         Returns:
             List of file IDs matching the fuzzy search
         """
+        return list(self._fuzzy_match_set(prefix, max_distance))
+
+    def _fuzzy_match_set(self, prefix: str, max_distance: int) -> set:
+        """Walk behind fuzzy_search_trie(); returns the matching ids as a set."""
         prefix = prefix.lower()
+        query_len = len(prefix)
+        automaton = get_levenshtein_automaton(prefix, max_distance)
         results = set()
 
-        def dfs(node: TrieNode, current_word: str, distance: int):
-            """Depth-first search with fuzzy matching."""
-            if distance > max_distance:
-                return
+        start = automaton.start()
+        stack = [(child, 0, start) for child in self.root.children.values()]
+
+        while stack:
+            node, depth, state = stack.pop()
 
-            # Calculate distance to prefix
-            curr_distance = self.levenshtein_distance(current_word, prefix[:len(current_word)], max_distance)
+            # Every position along an edge shares the node's file list
+            for char in node.label:
+                state = automaton.step(state, char)
+                if state is None:
+                    break
+                depth += 1
 
-            # If current word matches within threshold
-            if len(current_word) >= len(prefix) and curr_distance <= max_distance:
-                results.update(node.file_references)
+                # Position spells a word within range of the query; the file
+                # list already covers every longer word below it
+                if depth >= query_len and automaton.is_match(state):
+                    results.update(node.file_references)
+                    state = None
+                    break
 
-            # Continue searching if there's potential for matches
-            if curr_distance <= max_distance or len(current_word) < len(prefix):
-                for char, child_node in node.children.items():
-                    dfs(child_node, current_word + char, curr_distance)
+            if state is not None:
+                for child in node.children.values():
+                    stack.append((child, depth, state))
 
-        dfs(self.root, '', 0)
-        return list(results)
+        return results
 
     def exact_prefix_search(self, prefix: str) -> List[int]:
         """Fast exact prefix search using Trie."""
         prefix = prefix.lower()
         node = self.root
+        pos = 0
 
-        for char in prefix:
-            if char not in node.children:
+        while pos < len(prefix):
+            child = node.children.get(prefix[pos])
+            # The prefix may end part-way along the edge
+            if child is None or not child.label.startswith(prefix[pos:pos + len(child.label)]):
                 return []
-            node = node.children[char]
+            node = child
+            pos += len(child.label)
 
-        # Collect all files under this prefix
-        results = set()
-
-        def collect_files(n: TrieNode):
-            results.update(n.file_references)
-            for child in n.children.values():
-                collect_files(child)
+        if node is self.root:
+            return list(self.files_index.keys())
 
-        collect_files(node)
-        return list(results)
+        # insert_word records a file on every node along its path, so this
+        # node already holds every file under the prefix - no subtree walk
+        return list(node.file_references)
 
     def semantic_expand_query(self, query: str) -> List[str]:
         """Expand query with semantic keywords."""
@@ -328,20 +472,25 @@ class AdaptiveTrieFuzzySearch:
             'search_terms': []
         }
 
+        # Plain queries carry no filters
+        if '@' not in query:
+            filters['search_terms'] = query.split()
+            return filters
+
         # Extract @type: filter
-        type_match = re.search(r'@type:(\w+)', query, re.IGNORECASE)
+        type_match = _TYPE_FILTER.search(query)
         if type_match:
             filters['type'] = type_match.group(1).lower()
             query = query.replace(type_match.group(0), '').strip()
 
         # Extract @ext: filter
-        ext_match = re.search(r'@ext:(\w+)', query, re.IGNORECASE)
+        ext_match = _EXT_FILTER.search(query)
         if ext_match:
             filters['extension'] = ext_match.group(1).lower()
             query = query.replace(ext_match.group(0), '').strip()
 
         # Extract @size: filter
-        size_match = re.search(r'@size:([><])?(\d+\.?\d*)(kb|mb|gb)?', query, re.IGNORECASE)
+        size_match = _SIZE_FILTER.search(query)
         if size_match:
             operator = size_match.group(1) or '>'
             size = float(size_match.group(2))
@@ -359,7 +508,7 @@ class AdaptiveTrieFuzzySearch:
             query = query.replace(size_match.group(0), '').strip()
 
         # Extract @date: filter
-        date_match = re.search(r'@date:([><])?(\d{4}-\d{2}-\d{2})', query, re.IGNORECASE)
+        date_match = _DATE_FILTER.search(query)
         if date_match:
             operator = date_match.group(1) or '>'
             date_str = date_match.group(2)
@@ -377,9 +526,12 @@ class AdaptiveTrieFuzzySearch:
 
         return filters
 
-    def apply_filters(self, file_id: int, filters: Dict[str, Any]) -> bool:
+    def apply_filters(self, file_id: int, filters: Dict[str, Any],
+                      files_index: Optional[Dict[int, Dict[str, Any]]] = None) -> bool:
         """Check if file matches the given filters."""
-        file_data = self.files_index.get(file_id)
+        if files_index is None:
+            files_index = self.files_index
+        file_data = files_index.get(file_id)
         if not file_data:
             return False
 
@@ -437,7 +589,8 @@ class AdaptiveTrieFuzzySearch:
 
         return True
 
-    def calculate_score(self, file_id: int, query: str, match_type: str) -> float:
+    def calculate_score(self, file_id: int, query: str, match_type: str,
+                        files_index: Optional[Dict[int, Dict[str, Any]]] = None) -> float:
         """
         Calculate relevance score for a file.
 
@@ -447,20 +600,16 @@ class AdaptiveTrieFuzzySearch:
         - File popularity
         - Recency
         """
-        file_data = self.files_index.get(file_id)
+        if files_index is None:
+            files_index = self.files_index
+        file_data = files_index.get(file_id)
         if not file_data:
             return 0.0
 
         score = 0.0
 
         # Base score by match type
-        match_scores = {
-            'exact': 100,
-            'prefix': 80,
-            'fuzzy': 60,
-            'semantic': 40
-        }
-        score += match_scores.get(match_type, 30)
+        score += _MATCH_SCORES.get(match_type, 30)
 
         # Filename match bonus
         filename = file_data.get('name', '').lower()
@@ -507,6 +656,9 @@ class AdaptiveTrieFuzzySearch:
         if not query or not query.strip():
             return []
 
+        # replace_index may swap the index mid-search; read one snapshot
+        files_index = self.files_index
+
         # Parse filters
         filters = self.parse_advanced_filters(query)
         search_terms = ' '.join(filters['search_terms'])
@@ -539,40 +691,42 @@ class AdaptiveTrieFuzzySearch:
 
                 # Try exact prefix match first (fastest)
                 exact_matches = self.exact_prefix_search(expanded_query)
-                for file_id in exact_matches:
-                    if file_id not in matches:
-                        matches[file_id] = match_type
+                if not matches:
+                    matches = dict.fromkeys(exact_matches, match_type)
+                else:
+                    for file_id in exact_matches:
+                        if file_id not in matches:
+                            matches[file_id] = match_type
 
-                # Fuzzy search if enabled
+                # Fuzzy search if enabled; the fuzzy set also contains every
+                # exact hit, so drop what is already matched in one C-level
+                # pass instead of probing each id
                 if use_fuzzy:
-                    fuzzy_matches = self.fuzzy_search_trie(expanded_query, max_distance=2)
-                    for file_id in fuzzy_matches:
-                        if file_id not in matches:
-                            matches[file_id] = 'fuzzy'
+                    fuzzy_matches = self._fuzzy_match_set(expanded_query, max_distance=2)
+                    fuzzy_matches.difference_update(matches)
+                    matches.update(dict.fromkeys(fuzzy_matches, 'fuzzy'))
         else:
             # Only filters, no search terms - return all files
-            matches = {file_id: 'filter' for file_id in self.files_index.keys()}
+            matches = dict.fromkeys(files_index, 'filter')
 
-        # Apply filters
-        filtered_matches = {
-            file_id: match_type
+        # Filter and score in one pass, then keep only the top `limit` with a
+        # bounded heap (same order as a full stable sort) and copy just those
+        scored = (
+            (self.calculate_score(file_id, search_terms, match_type, files_index),
+             file_id, match_type)
             for file_id, match_type in matches.items()
-            if self.apply_filters(file_id, filters)
-        }
+            if self.apply_filters(file_id, filters, files_index)
+        )
+        top = heapq.nlargest(limit, scored, key=_BY_SCORE)
 
-        # Calculate scores and rank
-        scored_results = []
-        for file_id, match_type in filtered_matches.items():
-            score = self.calculate_score(file_id, search_terms, match_type)
-            file_data = self.files_index[file_id].copy()
+        results = []
+        for score, file_id, match_type in top:
+            file_data = files_index[file_id].copy()
             file_data['search_score'] = score
             file_data['match_type'] = match_type
-            scored_results.append(file_data)
+            results.append(file_data)
 
-        # Sort by score
-        scored_results.sort(key=lambda x: x['search_score'], reverse=True)
-
-        return scored_results[:limit]
+        return results
 
     def record_interaction(self, file_id: int, interaction_type: str, query: Optional[str] = None):
         """
@@ -607,11 +761,104 @@ class AdaptiveTrieFuzzySearch:
         }
 
     def _get_trie_depth(self, node: TrieNode, current_depth: int = 0) -> int:
-        """Calculate maximum depth of Trie."""
-        if not node.children:
-            return current_depth
-        return max(self._get_trie_depth(child, current_depth + 1)
-                  for child in node.children.values())
+        """Calculate maximum depth of Trie (iterative, no recursion limit)."""
+        max_depth = current_depth
+        stack = [(node, current_depth)]
+
+        while stack:
+            node, depth = stack.pop()
+            if depth > max_depth:
+                max_depth = depth
+            for child in node.children.values():
+                stack.append((child, depth + len(child.label)))
+
+        return max_depth
+
+    def replace_index(self, other: 'AdaptiveTrieFuzzySearch'):
+        """
+        Adopt another engine's Trie and file index, keeping interaction data.
+
+        Used to swap in an index rebuilt off to the side. search() reads
+        files_index once and filters, scores and copies from that snapshot,
+        so Trie matches from the other root that it lacks are skipped.
+        Files indexed into this engine after other was built are dropped by
+        the swap; the caller re-indexes them (see _rebuild_index).
+        """
+        self.files_index = other.files_index
+        self.root = other.root
+
+    def save(self, path: str):
+        """
+        Persist the Trie and file index so a new worker can load them.
+
+        Nodes are written as a flat pre-order list of
+        (parent_index, label, is_end_of_word, frequency, file_references),
+        which avoids deep recursion when pickling long words. The file is
+        written next to its destination and swapped in atomically.
+        """
+        nodes = []
+        stack = [(self.root, -1)]
+
+        while stack:
+            node, parent_index = stack.pop()
+            index = len(nodes)
+            nodes.append((parent_index, node.label, node.is_end_of_word,
+                          node.frequency, node.file_references))
+            for child in node.children.values():
+                stack.append((child, index))
+
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, 'wb') as f:
+            pickle.dump({
+                'version': INDEX_FORMAT_VERSION,
+                'nodes': nodes,
+                'files_index': self.files_index,
+            }, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, path)
+
+        logger.info(f"Search index saved: {len(self.files_index)} files, {len(nodes)} nodes")
+
+    def load(self, path: str) -> bool:
+        """
+        Replace the Trie and file index with a snapshot written by save().
+
+        Only load files this application wrote itself: the snapshot is a
+        pickle. Interaction history is not part of the snapshot.
+
+        Returns:
+            True if the snapshot was loaded, False if missing or unusable
+        """
+        if not os.path.exists(path):
+            return False
+
+        try:
+            with open(path, 'rb') as f:
+                data = pickle.load(f)
+
+            if data.get('version') != INDEX_FORMAT_VERSION:
+                logger.warning(f"Ignoring search index with unsupported format: {path}")
+                return False
+
+            built = []
+            for parent_index, label, is_end_of_word, frequency, file_references in data['nodes']:
+                node = TrieNode(label)
+                node.is_end_of_word = is_end_of_word
+                node.frequency = frequency
+                node.file_references = file_references
+                if parent_index >= 0:
+                    built[parent_index].children[label[0]] = node
+                built.append(node)
+
+        except Exception as e:
+            logger.warning(f"Failed to load search index from {path}: {e}")
+            return False
+
+        self.root = built[0] if built else TrieNode()
+        self.files_index = data['files_index']
+
+        logger.info(f"Search index loaded: {len(self.files_index)} files")
+        return True
 
 
 # Global instance for the application
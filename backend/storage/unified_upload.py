@@ -6,10 +6,13 @@ Handles both single and multiple file uploads in one endpoint
 import os
 import uuid
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import List, Dict, Any
 
 from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.utils import timezone
 from django.http import JsonResponse
 from django.views import View
 from django.views.decorators.csrf import csrf_exempt
@@ -22,6 +25,10 @@ from .file_organizer import file_organizer
 
 logger = logging.getLogger(__name__)
 
+# AI analysis takes seconds per file, so it runs after the upload response;
+# Ollama serves requests one at a time, so a couple of workers is plenty
+_AI_ANALYZER = ThreadPoolExecutor(max_workers=2, thread_name_prefix='ai-analysis')
+
 
 @method_decorator(csrf_exempt, name='dispatch')
 class UnifiedFileUploadView(View):
@@ -94,10 +101,10 @@ class UnifiedFileUploadView(View):
             media_file = self._save_and_organize_file(
                 uploaded_file, user_comment
             )
-
-            # Index if requested
-            if auto_index and file_search_store_id:
-                self._index_file(media_file, file_search_store_id)
+            self._schedule_analysis(
+                media_file, user_comment,
+                file_search_store_id if auto_index else None
+            )
 
             return JsonResponse(
                 {
@@ -115,8 +122,9 @@ class UnifiedFileUploadView(View):
                         'storage_category': media_file.storage_category,
                         'storage_subcategory': media_file.storage_subcategory,
                         'relative_path': media_file.relative_path,
+                        'ai_status': 'pending',
                     },
-                    'message': f'File uploaded and organized in {media_file.storage_category}/{media_file.storage_subcategory}/'
+                    'message': f'File uploaded and organized in {media_file.storage_category}/; AI analysis in progress'
                 },
                 status=201
             )
@@ -133,48 +141,76 @@ class UnifiedFileUploadView(View):
         """Process multiple file uploads."""
         # Create batch record
         batch = UploadBatch.objects.create(
-            batch_id=str(uuid.uuid4()),
+            batch_id=uuid.uuid4().hex,
             total_files=len(files),
             status='processing'
         )
 
-        results = []
-        processed = 0
-        failed = 0
-
+        # Write every file to disk first, then insert all records at once
+        outcomes = []
         for uploaded_file in files:
             try:
-                media_file = self._save_and_organize_file(
-                    uploaded_file, user_comment
+                outcomes.append(
+                    (uploaded_file, self._organize_file(uploaded_file, user_comment), None)
                 )
+            except Exception as e:
+                logger.error(f"Failed to process {uploaded_file.name}: {str(e)}")
+                outcomes.append((uploaded_file, None, e))
 
-                # Index if requested
-                if auto_index and file_search_store_id:
-                    self._index_file(media_file, file_search_store_id)
+        media_files = [media_file for _, media_file, _ in outcomes if media_file is not None]
+        if media_files:
+            try:
+                # batch_size splits large batches over several INSERTs; keep
+                # them all-or-nothing so a failure can't leave half a batch
+                with transaction.atomic():
+                    MediaFile.objects.bulk_create(media_files, batch_size=500)
+            except Exception as e:
+                logger.error(f"Failed to save batch {batch.batch_id}: {str(e)}")
+                for media_file in media_files:
+                    # No row points at the organized file; don't orphan it
+                    try:
+                        os.remove(media_file.file_path)
+                    except OSError as remove_error:
+                        logger.warning(f"Could not remove {media_file.file_path}: {remove_error}")
+                outcomes = [
+                    (uploaded_file, None, error or e)
+                    for uploaded_file, _, error in outcomes
+                ]
 
-                results.append({
-                    'file': uploaded_file.name,
-                    'status': 'success',
-                    'id': media_file.id,
-                    'category': media_file.storage_category,
-                    'subcategory': media_file.storage_subcategory,
-                })
-                processed += 1
+        results = []
+        processed = 0
+        failed = 0
 
-            except Exception as e:
-                logger.error(f"Failed to process {uploaded_file.name}: {str(e)}")
+        for uploaded_file, media_file, error in outcomes:
+            if media_file is None:
                 results.append({
                     'file': uploaded_file.name,
                     'status': 'failed',
-                    'error': str(e)
+                    'error': str(error)
                 })
                 failed += 1
+                continue
 
-        # Update batch status
-        batch.processed_files = processed
-        batch.failed_files = failed
-        batch.status = 'completed' if failed == 0 else 'partial'
-        batch.save()
+            self._schedule_analysis(
+                media_file, user_comment,
+                file_search_store_id if auto_index else None
+            )
+            results.append({
+                'file': uploaded_file.name,
+                'status': 'success',
+                'id': media_file.id,
+                'category': media_file.storage_category,
+                'subcategory': media_file.storage_subcategory,
+            })
+            processed += 1
+
+        # Update batch status without reloading the row
+        UploadBatch.objects.filter(pk=batch.pk).update(
+            processed_files=processed,
+            failed_files=failed,
+            status='completed' if failed == 0 else 'partial',
+            completed_at=timezone.now(),
+        )
 
         return JsonResponse(
             {
@@ -190,7 +226,18 @@ class UnifiedFileUploadView(View):
 
     def _save_and_organize_file(self, uploaded_file, user_comment=''):
         """
-        Save and organize a file using the file organizer.
+        Save and organize a file using the file organizer, and create its
+        database record.
+        """
+        media_file = self._organize_file(uploaded_file, user_comment)
+        media_file.save()
+
+        logger.info(f"File saved: {uploaded_file.name} -> {media_file.relative_path}")
+        return media_file
+
+    def _organize_file(self, uploaded_file, user_comment=''):
+        """
+        Write a file into the organized folders and return its unsaved record.
         This is the core logic shared between single and batch uploads.
         """
         # Use the file organizer to handle the file
@@ -198,7 +245,7 @@ class UnifiedFileUploadView(View):
         # 1. Detects file type
         # 2. Organizes into proper folder
         # 3. Generates unique filename
-        # 4. Creates database record
+        # 4. Builds the database record (saved by the caller)
 
         # Get file extension and content type
         file_extension = os.path.splitext(uploaded_file.name)[1].lower()
@@ -222,16 +269,12 @@ class UnifiedFileUploadView(View):
         # Get file size
         file_size = os.path.getsize(absolute_path)
 
-        # Get AI analysis (if available)
-        ai_result = self._analyze_with_ai(absolute_path, file_type, user_comment)
-
         # Convert file type to plural for database (legacy compatibility)
         file_type_plural = file_type + 's' if file_type != 'audio' else 'audio'
         if file_type == 'compressed':
             file_type_plural = 'compressed'
 
-        # Create database record
-        media_file = MediaFile.objects.create(
+        return MediaFile(
             original_name=uploaded_file.name,
             file_path=absolute_path,
             file_size=file_size,
@@ -239,18 +282,48 @@ class UnifiedFileUploadView(View):
             mime_type=content_type,
             file_extension=file_extension,
             magic_description=f'{file_type} file',
-            ai_category=ai_result.get('category'),
-            ai_subcategory=ai_result.get('subcategory'),
-            ai_tags=ai_result.get('tags', []),
-            ai_description=ai_result.get('description'),
             user_comment=user_comment,
             storage_category=file_type_plural,
-            storage_subcategory=ai_result.get('subcategory', 'general'),
+            # Filled in by the background AI analysis
+            storage_subcategory='general',
             relative_path=relative_path,
         )
 
-        logger.info(f"File saved: {uploaded_file.name} -> {relative_path}")
-        return media_file
+    def _schedule_analysis(self, media_file, user_comment, file_search_store_id=None):
+        """Queue AI analysis (and optional store indexing) for a saved file."""
+        file_type = self._detect_file_type_from_mime(
+            media_file.mime_type, media_file.file_extension
+        )
+        _AI_ANALYZER.submit(
+            self._analyze_and_update, media_file.id, media_file.file_path,
+            file_type, user_comment, file_search_store_id
+        )
+
+    def _analyze_and_update(self, media_file_id, file_path, file_type,
+                            user_comment, file_search_store_id=None):
+        """Background task: store AI results on the record, then index it if requested."""
+        try:
+            ai_result = self._analyze_with_ai(file_path, file_type, user_comment)
+
+            MediaFile.objects.filter(pk=media_file_id).update(
+                ai_category=ai_result.get('category'),
+                ai_subcategory=ai_result.get('subcategory'),
+                ai_tags=ai_result.get('tags', []),
+                ai_description=ai_result.get('description'),
+                storage_subcategory=ai_result.get('subcategory', 'general'),
+                # update() skips auto_now; listings version themselves on it
+                processed_at=timezone.now(),
+            )
+
+            # Index after the update so chunks carry the AI category and tags
+            if file_search_store_id:
+                media_file = MediaFile.objects.get(pk=media_file_id)
+                self._index_file(media_file, file_search_store_id)
+
+        except Exception as e:
+            logger.error(f"Background AI analysis failed for file {media_file_id}: {str(e)}")
+        finally:
+            close_old_connections()
 
     def _analyze_with_ai(self, file_path, file_type, user_comment):
         """Analyze file with AI if available."""
@@ -35,6 +35,7 @@ urlpatterns = [
     path('rag/search/', views.semantic_search, name='semantic-search'),
     path('rag/query/', views.rag_query, name='rag-query'),
     path('rag/reindex-all/', views.reindex_all, name='reindex-all'),
+    path('rag/reindex-status/<str:task_id>/', views.reindex_status, name='reindex-status'),
     path('rag/stats/', views.rag_stats, name='rag-stats'),
 
     # Gemini-style File Search Store endpoints
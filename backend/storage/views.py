@@ -3,13 +3,32 @@ API views for the intelligent storage system.
 """
 
 import os
+import errno
+import itertools
+import json
+import shutil
+import time
 import uuid
 import logging
+import secrets
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from functools import lru_cache
 from pathlib import Path
-from datetime import datetime
 
 from django.conf import settings
+from django.contrib.postgres.aggregates import ArrayAgg
+from django.core.cache import cache
 from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import TemporaryUploadedFile
+from django.db import IntegrityError, close_old_connections, connection, transaction
+from django.db.models import Count, Max, Q, Sum
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
+from pgvector import HalfVector
+from pgvector.django import CosineDistance
 from rest_framework import status, viewsets
 from rest_framework.decorators import api_view, action
 from rest_framework.response import Response
@@ -17,7 +36,7 @@ from rest_framework.views import APIView
 
 from .models import (
     MediaFile, JSONDataStore, UploadBatch, DocumentChunk,
-    FileSearchStore, SearchQuery, RAGResponse
+    FileSearchStore, SearchQuery, RAGResponse, ReindexTask
 )
 from .serializers import (
     MediaFileSerializer, JSONDataStoreSerializer,
@@ -28,13 +47,162 @@ from .serializers import (
     FileIndexRequestSerializer, SemanticSearchRequestSerializer,
     RAGQueryRequestSerializer
 )
+from . import renderers
 from .file_detector import file_detector
 from .ai_analyzer import ai_analyzer
+from .ollama_client import ollama_session
 from .db_manager import db_manager
 from .rag_service import rag_service
+from .trie_fuzzy_search import trie_search_engine
 
 logger = logging.getLogger(__name__)
 
+# Files of one batch upload processed concurrently (AI calls dominate)
+BATCH_UPLOAD_WORKERS = 8
+
+# Copy size for writing in-memory uploads to disk
+UPLOAD_COPY_BUFFER = 1024 * 1024
+
+# Resolved once; the upload helpers below run on every file
+_MEDIA_ROOT = os.fspath(settings.MEDIA_ROOT)
+_MEDIA_ROOT_PREFIX = os.path.join(_MEDIA_ROOT, '')
+_TEMP_DIR = os.path.join(_MEDIA_ROOT, 'temp')
+
+# Load balancers poll the health endpoint every second or two; serve repeat
+# probes from cache instead of hitting every backing service each time
+HEALTH_CACHE_TIMEOUT = 2
+# /api/tags stalls while Ollama is generating; keep the probe patient enough
+# not to report it down under normal load
+OLLAMA_PROBE_TIMEOUT = 2
+_HEALTH_PROBES = ThreadPoolExecutor(max_workers=4, thread_name_prefix='health-probe')
+
+# Reindexing takes minutes to hours, so it runs off the request thread. Its
+# state lives in ReindexTask so any worker can answer polls, and the table's
+# single-running constraint keeps it to one run across processes. A run whose
+# progress has not moved for REINDEX_STALE_AFTER is assumed to have died with
+# its process and no longer blocks a new one.
+REINDEX_STALE_AFTER = timedelta(hours=1)
+_REINDEXER = ThreadPoolExecutor(max_workers=1, thread_name_prefix='rag-reindex')
+
+
+@lru_cache(maxsize=1024)
+def _ensure_dir(path):
+    """Create a directory once; later calls for the same path are a cache hit."""
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def _save_temp_file(uploaded_file):
+    """Save uploaded file to temporary location."""
+    # Large uploads are already streamed to disk by Django; use that file as is
+    if isinstance(uploaded_file, TemporaryUploadedFile):
+        return uploaded_file.temporary_file_path()
+
+    # 96 random bits keep concurrent temp names apart; basename() guards
+    # against a client-supplied name carrying directory parts
+    temp_filename = f"{secrets.token_urlsafe(12)}_{os.path.basename(uploaded_file.name)}"
+    temp_path = os.path.join(_ensure_dir(_TEMP_DIR), temp_filename)
+
+    uploaded_file.seek(0)
+    try:
+        f = open(temp_path, 'wb', buffering=UPLOAD_COPY_BUFFER)
+    except FileNotFoundError:
+        # The temp directory was removed since it was created; recreate it
+        _ensure_dir.cache_clear()
+        _ensure_dir(_TEMP_DIR)
+        f = open(temp_path, 'wb', buffering=UPLOAD_COPY_BUFFER)
+
+    with f:
+        shutil.copyfileobj(uploaded_file.file, f, UPLOAD_COPY_BUFFER)
+
+    return temp_path
+
+
+def _analyze_with_ai(file_path, file_type, user_comment, head=None):
+    """Analyze file with AI."""
+    try:
+        if file_type == 'images':
+            return ai_analyzer.analyze_image(file_path, user_comment)
+        else:
+            return ai_analyzer.analyze_file_content(
+                file_path, file_type, user_comment, head=head
+            )
+    except Exception as e:
+        logger.warning("AI analysis failed: %s", e)
+        return {}
+
+
+def _move_file(src, dst):
+    """Move a file, copying when src and dst are on different filesystems."""
+    try:
+        os.replace(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(src, dst)
+
+
+def _organize_file(temp_path, category, subcategory, original_name):
+    """Move file to organized directory structure."""
+    # Create directory structure: media/{category}/{subcategory}/
+    target_dir = _ensure_dir(os.path.join(_MEDIA_ROOT, category, subcategory))
+
+    # Generate unique filename to avoid conflicts; batch workers finish
+    # same-named files within one second, so the timestamp alone is not enough
+    filename = f"{time.strftime('%Y%m%d_%H%M%S')}_{secrets.token_hex(4)}_{os.path.basename(original_name)}"
+    final_path = os.path.join(target_dir, filename)
+
+    # Move file (the temp file may live on another filesystem)
+    try:
+        _move_file(temp_path, final_path)
+    except FileNotFoundError:
+        if not os.path.exists(temp_path):
+            raise
+        # The target directory was removed since it was created; recreate it
+        _ensure_dir.cache_clear()
+        _ensure_dir(target_dir)
+        _move_file(temp_path, final_path)
+
+    # Django creates its upload temp files private to the process owner
+    if settings.FILE_UPLOAD_PERMISSIONS is not None:
+        os.chmod(final_path, settings.FILE_UPLOAD_PERMISSIONS)
+
+    return final_path
+
+
+def _get_relative_path(absolute_path):
+    """Get path relative to MEDIA_ROOT."""
+    # Paths built by _organize_file always start with the media root
+    if absolute_path.startswith(_MEDIA_ROOT_PREFIX):
+        return absolute_path[len(_MEDIA_ROOT_PREFIX):]
+    return os.path.relpath(absolute_path, _MEDIA_ROOT)
+
+
+def _media_files_etag(category=None):
+    """
+    Version tag for MediaFile listings: row count plus latest modification.
+
+    Any insert or delete changes the count and any save bumps processed_at,
+    so clients holding the tag can be answered with 304 Not Modified.
+    Bulk updates bypass auto_now and must set processed_at themselves; that
+    includes clearing file_search_store before a store is deleted, since
+    the SET_NULL cascade would not touch it.
+    """
+    files = MediaFile.objects.order_by()
+    if category:
+        files = files.filter(detected_type=category)
+    version = files.aggregate(count=Count('id'), latest=Max('processed_at'))
+    latest = version['latest'].timestamp() if version['latest'] else 0
+    return f"{version['count']}-{latest}"
+
+
+def _by_category_etag(request, *args, **kwargs):
+    return _media_files_etag(request.GET.get('category'))
+
+
+def _statistics_etag(request, *args, **kwargs):
+    return _media_files_etag()
+
 
 class MediaFileViewSet(viewsets.ModelViewSet):
     """ViewSet for MediaFile operations."""
@@ -43,6 +211,7 @@ class MediaFileViewSet(viewsets.ModelViewSet):
     serializer_class = MediaFileSerializer
 
     @action(detail=False, methods=['GET'])
+    @method_decorator(condition(etag_func=_by_category_etag))
     def by_category(self, request):
         """Get files grouped by category."""
         category = request.query_params.get('category')
@@ -55,20 +224,26 @@ class MediaFileViewSet(viewsets.ModelViewSet):
         return Response(serializer.data)
 
     @action(detail=False, methods=['GET'])
+    @method_decorator(condition(etag_func=_statistics_etag))
     def statistics(self, request):
         """Get storage statistics."""
-        from django.db.models import Count, Sum
+        # One GROUP BY query; the overall totals are summed from its rows
+        rows = (
+            MediaFile.objects.order_by()
+            .values_list('detected_type')
+            .annotate(count=Count('id'), size=Sum('file_size'))
+        )
+
+        by_type = {}
+        total_size = 0
+        for detected_type, count, size in rows:
+            by_type[detected_type] = count
+            total_size += size or 0
 
         stats = {
-            'total_files': MediaFile.objects.count(),
-            'by_type': dict(
-                MediaFile.objects.values('detected_type')
-                .annotate(count=Count('id'))
-                .values_list('detected_type', 'count')
-            ),
-            'total_size': MediaFile.objects.aggregate(
-                total=Sum('file_size')
-            )['total'] or 0,
+            'total_files': sum(by_type.values()),
+            'by_type': by_type,
+            'total_size': total_size,
         }
         return Response(stats)
 
@@ -76,6 +251,8 @@ class MediaFileViewSet(viewsets.ModelViewSet):
 class FileUploadView(APIView):
     """
     Handle single file uploads with intelligent categorization.
+
+    Not routed: upload/file/ is served by UnifiedFileUploadView.
     """
 
     def post(self, request):
@@ -98,22 +275,25 @@ class FileUploadView(APIView):
 
         try:
             # Save file temporarily
-            temp_path = self._save_temp_file(uploaded_file)
+            temp_path = _save_temp_file(uploaded_file)
 
-            # Detect file type
-            file_type, metadata = file_detector.detect_file_type(temp_path)
+            # Detect file type; the head read here also feeds the AI prompt
+            head = file_detector.read_head(temp_path)
+            file_type, metadata = file_detector.detect_file_type(temp_path, head)
 
             # Get AI analysis for better categorization
-            ai_result = self._analyze_with_ai(
-                temp_path, file_type, user_comment
+            ai_result = _analyze_with_ai(
+                temp_path, file_type, user_comment, head
             )
 
             # Determine subcategory
             subcategory = ai_result.get('category') or \
-                         file_detector.get_subcategory_suggestion(temp_path, ai_result)
+                         file_detector.get_subcategory_suggestion(
+                             temp_path, ai_result, (file_type, metadata)
+                         )
 
             # Move to organized location
-            final_path = self._organize_file(
+            final_path = _organize_file(
                 temp_path, file_type, subcategory, uploaded_file.name
             )
 
@@ -133,12 +313,11 @@ class FileUploadView(APIView):
                 user_comment=user_comment,
                 storage_category=file_type,
                 storage_subcategory=subcategory,
-                relative_path=self._get_relative_path(final_path),
+                relative_path=_get_relative_path(final_path),
             )
 
             # Auto-index file for fuzzy search
             try:
-                from .trie_fuzzy_search import trie_search_engine
                 file_dict = {
                     'id': media_file.id,
                     'name': media_file.original_name,
@@ -150,9 +329,9 @@ class FileUploadView(APIView):
                     'path': media_file.relative_path or media_file.file_path,
                 }
                 trie_search_engine.index_file(file_dict)
-                logger.info(f"Auto-indexed file {media_file.id} for search")
+                logger.info("Auto-indexed file %s for search", media_file.id)
             except Exception as e:
-                logger.warning(f"Failed to auto-index file: {e}")
+                logger.warning("Failed to auto-index file: %s", e)
                 # Don't fail the upload if indexing fails
 
             return Response(
@@ -165,66 +344,18 @@ class FileUploadView(APIView):
             )
 
         except Exception as e:
-            logger.error(f"File upload failed: {str(e)}")
+            logger.error("File upload failed: %s", e)
             return Response(
                 {'error': str(e)},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
-    def _save_temp_file(self, uploaded_file):
-        """Save uploaded file to temporary location."""
-        temp_dir = os.path.join(settings.MEDIA_ROOT, 'temp')
-        os.makedirs(temp_dir, exist_ok=True)
-
-        temp_filename = f"{uuid.uuid4()}_{uploaded_file.name}"
-        temp_path = os.path.join(temp_dir, temp_filename)
-
-        with open(temp_path, 'wb+') as f:
-            for chunk in uploaded_file.chunks():
-                f.write(chunk)
-
-        return temp_path
-
-    def _analyze_with_ai(self, file_path, file_type, user_comment):
-        """Analyze file with AI."""
-        try:
-            if file_type == 'images':
-                return ai_analyzer.analyze_image(file_path, user_comment)
-            else:
-                return ai_analyzer.analyze_file_content(
-                    file_path, file_type, user_comment
-                )
-        except Exception as e:
-            logger.warning(f"AI analysis failed: {str(e)}")
-            return {}
-
-    def _organize_file(self, temp_path, category, subcategory, original_name):
-        """Move file to organized directory structure."""
-        # Create directory structure: media/{category}/{subcategory}/
-        target_dir = os.path.join(
-            settings.MEDIA_ROOT,
-            category,
-            subcategory
-        )
-        os.makedirs(target_dir, exist_ok=True)
-
-        # Generate unique filename to avoid conflicts
-        filename = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{original_name}"
-        final_path = os.path.join(target_dir, filename)
-
-        # Move file
-        os.rename(temp_path, final_path)
-
-        return final_path
-
-    def _get_relative_path(self, absolute_path):
-        """Get path relative to MEDIA_ROOT."""
-        return os.path.relpath(absolute_path, settings.MEDIA_ROOT)
-
 
 class BatchFileUploadView(APIView):
     """
     Handle batch file uploads.
+
+    Not routed: upload/batch/ is served by UnifiedFileUploadView.
     """
 
     def post(self, request):
@@ -247,86 +378,87 @@ class BatchFileUploadView(APIView):
 
         # Create batch record
         batch = UploadBatch.objects.create(
-            batch_id=str(uuid.uuid4()),
+            batch_id=uuid.uuid4().hex,
             total_files=len(files),
             status='processing'
         )
 
-        results = []
-        processed = 0
-        failed = 0
-
-        for uploaded_file in files:
-            try:
-                # Process each file (reusing single upload logic)
-                temp_path = FileUploadView()._save_temp_file(uploaded_file)
-                file_type, metadata = file_detector.detect_file_type(temp_path)
-                ai_result = FileUploadView()._analyze_with_ai(
-                    temp_path, file_type, user_comment
-                )
-                subcategory = ai_result.get('category') or \
-                             file_detector.get_subcategory_suggestion(temp_path, ai_result)
-                final_path = FileUploadView()._organize_file(
-                    temp_path, file_type, subcategory, uploaded_file.name
+        # Each file is dominated by AI round trips, so overlap them; results
+        # are collected in upload order
+        with ThreadPoolExecutor(max_workers=min(BATCH_UPLOAD_WORKERS, len(files))) as executor:
+            # Stage every file first so type detection runs as one batched
+            # model inference instead of once per file
+            staged = list(executor.map(self._stage_one, files))
+            staged_paths = [path for path in staged if not isinstance(path, Exception)]
+            identified = iter(file_detector.identify_paths(staged_paths))
+            futures = [
+                executor.submit(
+                    self._process_one, uploaded_file, temp_path,
+                    None if isinstance(temp_path, Exception) else next(identified),
+                    user_comment,
                 )
+                for uploaded_file, temp_path in zip(files, staged)
+            ]
+            outcomes = [future.result() for future in futures]
 
-                media_file = MediaFile.objects.create(
-                    original_name=uploaded_file.name,
-                    file_path=final_path,
-                    file_size=metadata['file_size'],
-                    detected_type=file_type,
-                    mime_type=metadata['mime_type'],
-                    file_extension=metadata['extension'],
-                    magic_description=metadata['magic_description'],
-                    ai_category=ai_result.get('category'),
-                    ai_subcategory=subcategory,
-                    ai_tags=ai_result.get('tags', []),
-                    ai_description=ai_result.get('description'),
-                    user_comment=user_comment,
-                    storage_category=file_type,
-                    storage_subcategory=subcategory,
-                    relative_path=FileUploadView()._get_relative_path(final_path),
-                )
+        # One multi-row INSERT for every file that made it through processing
+        media_files = [media_file for _, media_file in outcomes if media_file is not None]
+        if media_files:
+            try:
+                # batch_size splits large batches over several INSERTs; keep
+                # them all-or-nothing so a failure can't leave half a batch
+                with transaction.atomic():
+                    MediaFile.objects.bulk_create(media_files, batch_size=500)
+            except Exception as e:
+                logger.error("Failed to save batch %s: %s", batch.batch_id, e)
+                for result, media_file in outcomes:
+                    if media_file is not None:
+                        result.update(status='failed', error=str(e))
+                        result.pop('category', None)
+                        # No row points at the organized file; don't orphan it
+                        try:
+                            os.remove(media_file.file_path)
+                        except OSError as remove_error:
+                            logger.warning(
+                                "Could not remove %s: %s", media_file.file_path, remove_error
+                            )
+                outcomes = [(result, None) for result, _ in outcomes]
 
-                # Auto-index file for fuzzy search
-                try:
-                    from .trie_fuzzy_search import trie_search_engine
-                    file_dict = {
-                        'id': media_file.id,
-                        'name': media_file.original_name,
-                        'type': media_file.detected_type or 'other',
-                        'size': media_file.file_size or 0,
-                        'uploaded_at': media_file.uploaded_at.isoformat() if media_file.uploaded_at else None,
-                        'tags': media_file.ai_tags or [],
-                        'extension': media_file.file_extension or '',
-                        'path': media_file.relative_path or media_file.file_path,
-                    }
-                    trie_search_engine.index_file(file_dict)
-                except Exception as idx_err:
-                    logger.warning(f"Failed to auto-index file {media_file.id}: {idx_err}")
-
-                results.append({
-                    'file': uploaded_file.name,
-                    'status': 'success',
-                    'category': f"{file_type}/{subcategory}"
-                })
-                processed += 1
+        results = []
+        processed = 0
+        failed = 0
 
-            except Exception as e:
-                logger.error(f"Failed to process {uploaded_file.name}: {str(e)}")
-                results.append({
-                    'file': uploaded_file.name,
-                    'status': 'failed',
-                    'error': str(e)
-                })
+        for result, media_file in outcomes:
+            results.append(result)
+            if media_file is None:
                 failed += 1
+                continue
+            processed += 1
+
+            # Auto-index file for fuzzy search (on this thread; the trie is
+            # not safe for concurrent writers)
+            try:
+                file_dict = {
+                    'id': media_file.id,
+                    'name': media_file.original_name,
+                    'type': media_file.detected_type or 'other',
+                    'size': media_file.file_size or 0,
+                    'uploaded_at': media_file.uploaded_at.isoformat() if media_file.uploaded_at else None,
+                    'tags': media_file.ai_tags or [],
+                    'extension': media_file.file_extension or '',
+                    'path': media_file.relative_path or media_file.file_path,
+                }
+                trie_search_engine.index_file(file_dict)
+            except Exception as idx_err:
+                logger.warning("Failed to auto-index file %s: %s", media_file.id, idx_err)
 
         # Update batch record
-        batch.processed_files = processed
-        batch.failed_files = failed
-        batch.status = 'completed'
-        batch.completed_at = datetime.now()
-        batch.save()
+        UploadBatch.objects.filter(pk=batch.pk).update(
+            processed_files=processed,
+            failed_files=failed,
+            status='completed',
+            completed_at=timezone.now(),
+        )
 
         return Response(
             {
@@ -340,6 +472,69 @@ class BatchFileUploadView(APIView):
             status=status.HTTP_201_CREATED
         )
 
+    def _stage_one(self, uploaded_file):
+        """Save one file of the batch to disk; returns its path or the error."""
+        try:
+            return _save_temp_file(uploaded_file)
+        except Exception as e:
+            return e
+
+    def _process_one(self, uploaded_file, temp_path, magika_result, user_comment):
+        """
+        Categorize and store a single staged file of the batch (runs on a
+        worker thread).
+
+        Returns:
+            (result dict, unsaved MediaFile or None on failure)
+        """
+        try:
+            if isinstance(temp_path, Exception):
+                raise temp_path
+            head = file_detector.read_head(temp_path)
+            file_type, metadata = file_detector.detect_file_type(
+                temp_path, head, magika_result
+            )
+            ai_result = _analyze_with_ai(temp_path, file_type, user_comment, head)
+            subcategory = ai_result.get('category') or \
+                         file_detector.get_subcategory_suggestion(
+                             temp_path, ai_result, (file_type, metadata)
+                         )
+            final_path = _organize_file(
+                temp_path, file_type, subcategory, uploaded_file.name
+            )
+
+            media_file = MediaFile(
+                original_name=uploaded_file.name,
+                file_path=final_path,
+                file_size=metadata['file_size'],
+                detected_type=file_type,
+                mime_type=metadata['mime_type'],
+                file_extension=metadata['extension'],
+                magic_description=metadata['magic_description'],
+                ai_category=ai_result.get('category'),
+                ai_subcategory=subcategory,
+                ai_tags=ai_result.get('tags', []),
+                ai_description=ai_result.get('description'),
+                user_comment=user_comment,
+                storage_category=file_type,
+                storage_subcategory=subcategory,
+                relative_path=_get_relative_path(final_path),
+            )
+
+            return {
+                'file': uploaded_file.name,
+                'status': 'success',
+                'category': f"{file_type}/{subcategory}"
+            }, media_file
+
+        except Exception as e:
+            logger.error("Failed to process %s: %s", uploaded_file.name, e)
+            return {
+                'file': uploaded_file.name,
+                'status': 'failed',
+                'error': str(e)
+            }, None
+
 
 class JSONDataUploadView(APIView):
     """
@@ -367,7 +562,7 @@ class JSONDataUploadView(APIView):
         user_comment = serializer.validated_data.get('user_comment', '')
         force_db_type = serializer.validated_data.get('force_db_type')
         name = serializer.validated_data.get('name') or \
-               f"dataset_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+               f"dataset_{timezone.now().strftime('%Y%m%d_%H%M%S')}"
 
         try:
             # Get AI recommendation
@@ -403,6 +598,7 @@ class JSONDataUploadView(APIView):
 
             # Create tracking record
             record_count = len(json_data) if isinstance(json_data, list) else 1
+            structure_depth, has_nested, has_arrays = self._analyze_structure(json_data)
 
             json_store = JSONDataStore.objects.create(
                 name=name,
@@ -413,9 +609,9 @@ class JSONDataUploadView(APIView):
                 collection_name=storage_result.get('collection'),
                 inferred_schema=ai_result.get('suggested_schema', {}),
                 sample_data=json_data[0] if isinstance(json_data, list) and json_data else json_data,
-                structure_depth=self._get_depth(json_data),
-                has_nested_objects=self._has_nested(json_data),
-                has_arrays=self._has_arrays(json_data),
+                structure_depth=structure_depth,
+                has_nested_objects=has_nested,
+                has_arrays=has_arrays,
                 ai_reasoning=ai_result.get('reasoning'),
                 user_comment=user_comment,
                 record_count=record_count,
@@ -467,7 +663,7 @@ class JSONDataUploadView(APIView):
                     json_store=json_store
                 )
             except Exception as e:
-                logger.warning(f"Failed to save schema file: {str(e)}")
+                logger.warning("Failed to save schema file: %s", e)
 
             # Prepare response in the format frontend expects
             response_data = {
@@ -489,54 +685,72 @@ class JSONDataUploadView(APIView):
             return Response(response_data, status=status.HTTP_201_CREATED)
 
         except Exception as e:
-            logger.error(f"JSON upload failed: {str(e)}")
+            logger.error("JSON upload failed: %s", e)
             return Response(
                 {'error': str(e)},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
-    def _get_depth(self, obj, current=0):
-        """Calculate nesting depth."""
-        if isinstance(obj, dict):
-            return max([self._get_depth(v, current + 1) for v in obj.values()] or [current])
-        elif isinstance(obj, list) and obj:
-            return max([self._get_depth(item, current) for item in obj] or [current])
-        return current
-
-    def _has_nested(self, obj):
-        """Check for nested objects."""
-        if isinstance(obj, dict):
-            return any(isinstance(v, dict) for v in obj.values())
-        elif isinstance(obj, list) and obj:
-            return any(isinstance(item, dict) and
-                      any(isinstance(v, dict) for v in item.values())
-                      for item in obj if isinstance(item, dict))
-        return False
+    def _analyze_structure(self, obj):
+        """
+        Measure nesting depth and look for nested objects/arrays in one pass.
 
-    def _has_arrays(self, obj):
-        """Check for arrays."""
-        if isinstance(obj, dict):
-            return any(isinstance(v, list) for v in obj.values())
-        elif isinstance(obj, list) and obj:
-            return any(isinstance(item, dict) and
-                      any(isinstance(v, list) for v in item.values())
-                      for item in obj if isinstance(item, dict))
-        return False
+        The nested/array flags only look at the top-level object, or at the
+        objects directly inside a top-level array.
+
+        Returns:
+            Tuple of (depth, has_nested, has_arrays)
+        """
+        max_depth = 0
+        has_nested = has_arrays = False
+
+        # (dict, depth, is_record) - walked iteratively so deep JSON can't
+        # hit the recursion limit. Lists add no depth, so their containers
+        # are unpacked straight onto the stack instead of being pushed.
+        stack = [(obj, 0, True)] if isinstance(obj, dict) else []
+        pending = [(obj, 0, True)] if isinstance(obj, list) else []
+        push = stack.append
+
+        while stack or pending:
+            while pending:
+                items, depth, top_level = pending.pop()
+                for item in items:
+                    if isinstance(item, dict):
+                        push((item, depth, top_level))
+                    elif isinstance(item, list):
+                        pending.append((item, depth, False))
+
+            if not stack:
+                break
+
+            node, depth, is_record = stack.pop()
+            if not node:
+                if depth > max_depth:
+                    max_depth = depth
+                continue
+            depth += 1
+            if depth > max_depth:
+                max_depth = depth
+            for value in node.values():
+                if isinstance(value, dict):
+                    has_nested = has_nested or is_record
+                    push((value, depth, False))
+                elif isinstance(value, list):
+                    has_arrays = has_arrays or is_record
+                    pending.append((value, depth, False))
+
+        return max_depth, has_nested, has_arrays
 
     def _save_schema_file(self, schema_display, db_type, name, json_store):
         """Save generated schema as a file accessible in file browser."""
-        import os
-        import json as json_module
-        from datetime import datetime
-        from django.conf import settings
-        from .models import MediaFile
+        now = timezone.now()
 
         # Prepare schema content
         if db_type == 'SQL':
             # Save as .sql file
             file_extension = '.sql'
             content = f"""-- SQL Schema for: {name}
--- Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+-- Generated: {now.strftime('%Y-%m-%d %H:%M:%S')}
 -- Database Type: PostgreSQL
 -- Table Name: {schema_display.get('table_name')}
 
@@ -552,21 +766,21 @@ class JSONDataUploadView(APIView):
             file_extension = '.json'
             schema_doc = {
                 'schema_name': name,
-                'generated_at': datetime.now().isoformat(),
+                'generated_at': now.isoformat(),
                 'database_type': 'MongoDB (NoSQL)',
                 'collection_name': schema_display.get('collection_name'),
                 'document_structure': schema_display.get('document_structure'),
                 'sample_document': json_store.sample_data
             }
-            content = json_module.dumps(schema_doc, indent=2)
+            content = json.dumps(schema_doc, indent=2)
 
         # Generate filename
         safe_name = name.lower().replace(' ', '_').replace('-', '_')
         filename = f"{safe_name}_schema{file_extension}"
 
         # Create directory structure
-        year = datetime.now().year
-        month = datetime.now().month
+        year = now.year
+        month = now.month
         relative_dir = os.path.join('schemas', str(year), f'{month:02d}')
         full_dir = os.path.join(settings.MEDIA_ROOT, relative_dir)
         os.makedirs(full_dir, exist_ok=True)
@@ -600,10 +814,25 @@ class JSONDataUploadView(APIView):
         json_store.schema_file = media_file
         json_store.save()
 
-        logger.info(f"Saved schema file: {filename} (ID: {media_file.id})")
+        logger.info("Saved schema file: %s (ID: %s)", filename, media_file.id)
         return media_file
 
 
+def _ndjson_lines(rows):
+    """
+    Encode each row as one line of JSON.
+
+    The status line has already gone out by the time a read fails mid-stream,
+    so the failure is reported as a final {"error": ...} line instead.
+    """
+    try:
+        for row in rows:
+            yield renderers.dumps(row) + b'\n'
+    except Exception as e:
+        logger.error("Streaming query failed: %s", e)
+        yield renderers.dumps({'error': str(e)}) + b'\n'
+
+
 class JSONDataViewSet(viewsets.ModelViewSet):
     """ViewSet for JSONDataStore operations."""
 
@@ -612,10 +841,37 @@ class JSONDataViewSet(viewsets.ModelViewSet):
 
     @action(detail=True, methods=['GET'])
     def query(self, request, pk=None):
-        """Query data from the stored dataset."""
+        """
+        Query data from the stored dataset.
+
+        With ?stream=1 the rows are streamed as newline-delimited JSON while
+        they are read from the database, instead of being collected into one
+        response body.
+        """
         json_store = self.get_object()
         limit = int(request.query_params.get('limit', 100))
 
+        if request.query_params.get('stream') in ('1', 'true'):
+            if json_store.database_type == 'NoSQL':
+                rows = db_manager.iter_mongodb(json_store.collection_name, limit=limit)
+            else:
+                rows = db_manager.iter_postgresql(json_store.table_name, limit=limit)
+
+            # Read the first row before answering so a bad query still gets
+            # a proper error status rather than a 200 with an error line
+            try:
+                first = next(rows, None)
+            except Exception as e:
+                return Response(
+                    {'error': str(e)},
+                    status=status.HTTP_500_INTERNAL_SERVER_ERROR
+                )
+            if first is not None:
+                rows = itertools.chain((first,), rows)
+            return StreamingHttpResponse(
+                _ndjson_lines(rows), content_type='application/x-ndjson'
+            )
+
         try:
             if json_store.database_type == 'NoSQL':
                 results = db_manager.query_mongodb(
@@ -627,7 +883,6 @@ class JSONDataViewSet(viewsets.ModelViewSet):
                     json_store.table_name,
                     limit=limit
                 )
-
             return Response({
                 'success': True,
                 'data': results,
@@ -660,19 +915,26 @@ def health_check(request):
     """Health check endpoint."""
     return Response({
         'status': 'healthy',
-        'services': {
-            'django': True,
-            'postgresql': _check_postgres(),
-            'mongodb': _check_mongodb(),
-            'ollama': _check_ollama(),
-        }
+        'services': cache.get_or_set(
+            'health_services', _probe_services, HEALTH_CACHE_TIMEOUT
+        )
     })
 
 
+def _probe_services():
+    """Run the service checks, overlapping the slow Ollama probe with the rest."""
+    ollama = _HEALTH_PROBES.submit(_check_ollama)
+    return {
+        'django': True,
+        'postgresql': _check_postgres(),
+        'mongodb': _check_mongodb(),
+        'ollama': ollama.result(),
+    }
+
+
 def _check_postgres():
     """Check PostgreSQL connection."""
     try:
-        from django.db import connection
         connection.ensure_connection()
         return True
     except Exception:
@@ -690,10 +952,9 @@ def _check_mongodb():
 def _check_ollama():
     """Check Ollama availability."""
     try:
-        import requests
-        response = requests.get(
+        response = ollama_session.get(
             f"{settings.OLLAMA_SETTINGS['HOST']}/api/tags",
-            timeout=5
+            timeout=OLLAMA_PROBE_TIMEOUT
         )
         return response.status_code == 200
     except Exception:
@@ -727,7 +988,7 @@ def index_document(request, file_id):
             status=status.HTTP_404_NOT_FOUND
         )
     except Exception as e:
-        logger.error(f"Indexing failed: {str(e)}")
+        logger.error("Indexing failed: %s", e)
         return Response(
             {'error': str(e)},
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -771,7 +1032,7 @@ def semantic_search(request):
         })
 
     except Exception as e:
-        logger.error(f"Search failed: {str(e)}")
+        logger.error("Search failed: %s", e)
         return Response(
             {'error': str(e)},
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -813,29 +1074,94 @@ def rag_query(request):
             return Response(result, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
     except Exception as e:
-        logger.error(f"RAG query failed: {str(e)}")
+        logger.error("RAG query failed: %s", e)
         return Response(
             {'error': str(e)},
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
         )
 
 
+def _update_reindex_task(task_id, **fields):
+    ReindexTask.objects.filter(task_id=task_id).update(updated_at=timezone.now(), **fields)
+
+
+def _run_reindex(task_id):
+    """Background task: reindex every document, recording progress on its ReindexTask."""
+    def report(current, total):
+        _update_reindex_task(task_id, state='PROGRESS', current=current, total=total)
+
+    try:
+        result = rag_service.reindex_all_documents(progress=report)
+        _update_reindex_task(task_id, state='SUCCESS', result=result, is_running=False)
+    except Exception as e:
+        logger.error("Reindexing failed: %s", e)
+        _update_reindex_task(task_id, state='FAILURE', error=str(e), is_running=False)
+    finally:
+        close_old_connections()
+
+
 @api_view(['POST'])
 def reindex_all(request):
     """
-    Reindex all documents in the system.
+    Start reindexing all documents in the background.
+
+    Returns the task id to poll with reindex_status; while a reindex is
+    running, the id of that run is returned instead of starting another.
     """
+    ReindexTask.objects.filter(
+        is_running=True,
+        updated_at__lt=timezone.now() - REINDEX_STALE_AFTER
+    ).update(state='FAILURE', error='Reindex stopped reporting progress', is_running=False)
+
+    task_id = uuid.uuid4().hex
     try:
-        result = rag_service.reindex_all_documents()
-        return Response(result)
+        with transaction.atomic():
+            ReindexTask.objects.create(task_id=task_id)
+    except IntegrityError:
+        running = ReindexTask.objects.filter(is_running=True).first()
+        if running is not None:
+            return Response(
+                {'task_id': running.task_id, 'status': 'already running'},
+                status=status.HTTP_202_ACCEPTED
+            )
+        # The running task finished between the insert and the lookup
+        with transaction.atomic():
+            ReindexTask.objects.create(task_id=task_id)
 
+    try:
+        _REINDEXER.submit(_run_reindex, task_id)
     except Exception as e:
-        logger.error(f"Reindexing failed: {str(e)}")
+        _update_reindex_task(task_id, state='FAILURE', error=str(e), is_running=False)
+        logger.error("Failed to start reindexing: %s", e)
         return Response(
             {'error': str(e)},
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
         )
 
+    return Response({'task_id': task_id}, status=status.HTTP_202_ACCEPTED)
+
+
+@api_view(['GET'])
+def reindex_status(request, task_id):
+    """
+    Get the state and progress of a background reindex.
+    """
+    task = ReindexTask.objects.filter(task_id=task_id).first()
+    if task is None:
+        return Response(
+            {'error': 'Unknown task'},
+            status=status.HTTP_404_NOT_FOUND
+        )
+
+    task_status = {'task_id': task.task_id, 'state': task.state}
+    if task.state == 'PROGRESS':
+        task_status.update(current=task.current, total=task.total)
+    elif task.state == 'SUCCESS':
+        task_status['result'] = task.result
+    elif task.state == 'FAILURE':
+        task_status['error'] = task.error
+    return Response(task_status)
+
 
 @api_view(['GET'])
 def rag_stats(request):
@@ -843,18 +1169,23 @@ def rag_stats(request):
     Get RAG system statistics.
     """
     try:
-        total_chunks = DocumentChunk.objects.count()
-        indexed_files = DocumentChunk.objects.values('media_file').distinct().count()
-        file_types = DocumentChunk.objects.values('file_type').distinct()
+        # All three figures in a single scan
+        stats = DocumentChunk.objects.aggregate(
+            total_chunks=Count('id'),
+            indexed_files=Count('media_file', distinct=True),
+            file_types=ArrayAgg('file_type', distinct=True),
+        )
 
         return Response({
-            'total_chunks': total_chunks,
-            'indexed_files': indexed_files,
-            'file_types': list(file_types)
+            'total_chunks': stats['total_chunks'],
+            'indexed_files': stats['indexed_files'],
+            'file_types': [
+                {'file_type': file_type} for file_type in stats['file_types'] or []
+            ]
         })
 
     except Exception as e:
-        logger.error(f"Failed to get stats: {str(e)}")
+        logger.error("Failed to get stats: %s", e)
         return Response(
             {'error': str(e)},
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -898,12 +1229,21 @@ class FileSearchStoreViewSet(viewsets.ModelViewSet):
             )
 
         except Exception as e:
-            logger.error(f"Failed to create file search store: {str(e)}")
+            logger.error("Failed to create file search store: %s", e)
             return Response(
                 {'error': str(e)},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
+    def perform_destroy(self, instance):
+        """Detach files from the store, bumping processed_at, then delete it."""
+        with transaction.atomic():
+            MediaFile.objects.filter(file_search_store=instance).update(
+                file_search_store=None,
+                processed_at=timezone.now()
+            )
+            instance.delete()
+
     @action(detail=True, methods=['GET'])
     def files(self, request, store_id=None):
         """Get all files in this store."""
@@ -969,7 +1309,8 @@ class FileSearchStoreViewSet(viewsets.ModelViewSet):
             # Update files to remove store reference
             MediaFile.objects.filter(file_search_store=store).update(
                 file_search_store=None,
-                is_indexed=False
+                is_indexed=False,
+                processed_at=timezone.now()
             )
 
             # Delete the store
@@ -1078,7 +1419,7 @@ def index_file_to_store(request):
 
         # Update media file
         media_file.is_indexed = True
-        media_file.indexed_at = datetime.now()
+        media_file.indexed_at = timezone.now()
         media_file.file_search_store = store
         media_file.custom_metadata.update(custom_metadata)
         media_file.save()
@@ -1112,7 +1453,7 @@ def index_file_to_store(request):
             status=status.HTTP_404_NOT_FOUND
         )
     except Exception as e:
-        logger.error(f"Failed to index file: {str(e)}")
+        logger.error("Failed to index file: %s", e)
         return Response(
             {'error': str(e)},
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -1140,7 +1481,6 @@ def semantic_search_with_filters(request):
 
     try:
         from .embedding_service import embedding_service
-        from django.db.models import Q
 
         # Generate query embedding
         query_embedding = embedding_service.generate_embedding(query)
@@ -1160,7 +1500,7 @@ def semantic_search_with_filters(request):
 
         # Search using pgvector
         chunks = DocumentChunk.objects.filter(filter_q).order_by(
-            DocumentChunk.embedding.cosine_distance(query_embedding)
+            CosineDistance('embedding', HalfVector(query_embedding))
         )[:limit]
 
         # Build response
@@ -1208,7 +1548,7 @@ def semantic_search_with_filters(request):
         })
 
     except Exception as e:
-        logger.error(f"Search failed: {str(e)}")
+        logger.error("Search failed: %s", e)
         return Response(
             {'error': str(e)},
             status=status.HTTP_500_INTERNAL_SERVER_ERROR